@@ -1,19 +1,29 @@
 import { app, BrowserWindow, Menu, ipcMain, dialog, shell } from 'electron';
 import * as path from 'path';
+import { promises as fs } from 'fs';
 import Store from 'electron-store';
 
 // Initialize electron store for persistent data
 const store = new Store();
 
+// HTTP disk cache size. Card thumbnails and details images are served from
+// Scryfall's CDN with long cache lifetimes, so give them room to survive restarts.
+const DISK_CACHE_SIZE = 256 * 1024 * 1024;
+
 class DecksmithApp {
   private mainWindow: BrowserWindow | null = null;
   private isDev = process.env.NODE_ENV === 'development';
+  // Files the user picked in an open dialog; the renderer may only read these
+  private openedFiles: Set<string> = new Set();
 
   constructor() {
     this.setupApp();
   }
 
   private setupApp(): void {
+    // Must be set before the app is ready
+    app.commandLine.appendSwitch('disk-cache-size', DISK_CACHE_SIZE.toString());
+
     // Handle app ready
     app.whenReady().then(() => {
       this.createWindow();
@@ -196,9 +206,17 @@ class DecksmithApp {
     // File operations
     ipcMain.handle('dialog:openFile', async (event, options) => {
       const result = await dialog.showOpenDialog(this.mainWindow!, options);
+      result.filePaths.forEach(filePath => this.openedFiles.add(filePath));
       return result;
     });
 
+    ipcMain.handle('file:readText', async (event, filePath) => {
+      if (!this.openedFiles.has(filePath)) {
+        throw new Error('File was not selected through the open dialog');
+      }
+      return fs.readFile(filePath, 'utf8');
+    });
+
     ipcMain.handle('dialog:saveFile', async (event, options) => {
       const result = await dialog.showSaveDialog(this.mainWindow!, options);
       return result;
@@ -13,6 +13,11 @@ class DecksmithApp {
   private currentTab = 'collection';
   private collectionData: Collection = { cards: [], lastModified: new Date().toISOString() };
   private decksData: Deck[] = [];
+  // Set once the decks were actually read from the store
+  private decksLoaded = false;
+  // Collection exactly as read from the store: null when nothing was saved,
+  // undefined when the read failed so CollectionTab reads the store itself
+  private storedCollection: Collection | null | undefined = undefined;
   
   // Tab components
   private collectionTab!: CollectionTab;
@@ -75,19 +80,27 @@ class DecksmithApp {
     //   this.aiTab = new AIRecommendationsTab();
     // }
     
-    // Initialize components
+    // Hand over the decks we already read from the store so DecksTab
+    // doesn't issue a second store round-trip for the same data. If that
+    // read failed, DecksTab loads (and reports errors for) its own decks.
+    if (this.decksLoaded) {
+      this.decksTab.setDecks(this.decksData);
+    }
+    // Deck imports reuse card data for cards the user already owns
+    this.collectionTab.setOnCollectionChange(collection => this.decksTab.setCollection(collection));
+
+    // Initialize components. Only the collection tab is visible at startup;
+    // the decks tab renders its DOM the first time switchTab() opens it.
     console.log('Calling initialize on components...');
     this.collectionTab.initialize();
-    this.decksTab.initialize();
     // if (ENABLE_AI_RECOMMENDATIONS && this.aiTab) {
     //   this.aiTab.initialize();
     // }
     
-    // Load collection data asynchronously
-    this.collectionTab.loadCollectionData();
+    // Load collection data asynchronously, reusing the store read from loadData
+    this.collectionTab.loadCollectionData(this.storedCollection);
     
     // Pass data to other components
-    this.decksTab.setDecks(this.decksData);
     // if (ENABLE_AI_RECOMMENDATIONS && this.aiTab) {
     //   this.aiTab.setDecks(this.decksData);
     //   this.aiTab.setCollection(this.collectionData);
@@ -203,8 +216,15 @@ class DecksmithApp {
 
   private async loadData(): Promise<void> {
     try {
+      // The two reads are independent IPC round-trips, so issue them together
+      // rather than waiting on the collection before asking for the decks
+      const [savedCollection, savedDecks] = await Promise.all([
+        window.electronAPI?.store.get('collection'),
+        window.electronAPI?.store.get('decks')
+      ]);
+
       // Load collection
-      const savedCollection = await window.electronAPI?.store.get('collection');
+      this.storedCollection = savedCollection || null;
       if (savedCollection) {
         this.collectionData = savedCollection;
       } else {
@@ -271,7 +291,6 @@ class DecksmithApp {
       }
 
       // Load decks
-      const savedDecks = await window.electronAPI?.store.get('decks');
       if (savedDecks) {
         this.decksData = savedDecks;
       } else {
@@ -317,6 +336,7 @@ class DecksmithApp {
           }
         ];
       }
+      this.decksLoaded = true;
 
       this.updateStatus('Data loaded successfully');
     } catch (error) {
@@ -1,7 +1,11 @@
 import { BaseComponent } from './BaseComponent';
 import { RecommendationEngine, SmartRecommendation, DeckAnalysis } from './RecommendationEngine';
+import { CardDetailsModal } from './CardDetailsModal';
 import type { Deck, Card } from '../types';
 
+// Recommendations listed under the progress indicator while a run is going
+const PARTIAL_RESULTS_SHOWN = 20;
+
 export class AIRecommendationsTab extends BaseComponent {
   private selectedDeck: Deck | null = null;
   private recommendations: SmartRecommendation[] = [];
@@ -11,7 +15,6 @@ export class AIRecommendationsTab extends BaseComponent {
   private recommendationEngine: RecommendationEngine;
   private collection: any = null; // Will be set by parent
   private availableDecks: Deck[] = []; // Store available decks
-  private cardDetailsModal: any = null; // Will be imported when needed
   
   // Pagination/infinite scroll properties
   private displayedCount = 20; // Start with 20 cards
@@ -22,6 +25,14 @@ export class AIRecommendationsTab extends BaseComponent {
   private compactMode = true; // Start in compact mode
   private expandedCards = new Set<string>(); // Track expanded cards
 
+  // Progress updates are painted at most once per frame
+  private pendingProgress: { phase: string, count: number, total: number, recommendations: any[] } | null = null;
+  private progressFrame = 0;
+  private scrollListenerAttached = false;
+  private partialResultsShown = 0; // Partial results currently in the loading view
+  private viewDetailsHandler: ((e: Event) => void) | null = null;
+  private recommendationsController: AbortController | null = null;
+
   constructor() {
     super('#ai-recommendations-tab');
     this.recommendationEngine = new RecommendationEngine();
@@ -215,6 +226,9 @@ export class AIRecommendationsTab extends BaseComponent {
     if (deck) {
       this.selectedDeck = deck;
       console.log(`Successfully selected deck: ${deck.name}`);
+
+      // Recommendations for the previous deck are no longer wanted
+      this.cancelRecommendations();
       
       // Clear previous analysis and recommendations
       this.recommendations = [];
@@ -235,6 +249,14 @@ export class AIRecommendationsTab extends BaseComponent {
     }
   }
 
+  private cancelRecommendations(): void {
+    if (!this.recommendationsController) return;
+    this.recommendationsController.abort();
+    this.recommendationsController = null;
+    this.cancelProgressUpdate();
+    this.isLoading = false;
+  }
+
   private clearAnalysisDisplay(): void {
     const analysisPanel = this.element.querySelector('#deck-analysis');
     if (analysisPanel) {
@@ -331,6 +353,11 @@ export class AIRecommendationsTab extends BaseComponent {
     }
 
     console.log('Getting recommendations for:', this.selectedDeck.name);
+
+    // Supersede any run still in flight rather than letting it finish
+    this.recommendationsController?.abort();
+    const controller = new AbortController();
+    this.recommendationsController = controller;
     this.isLoading = true;
     this.showRecommendationsLoading();
 
@@ -350,22 +377,33 @@ export class AIRecommendationsTab extends BaseComponent {
         'standard', // Format - could be made configurable
         (progress: { phase: string, count: number, total: number, recommendations: any[] }) => {
           // Update UI with partial results
-          this.showProgressiveResults(progress);
-        }
+          if (!controller.signal.aborted) this.queueProgressUpdate(progress);
+        },
+        controller.signal
       );
+      if (controller.signal.aborted) return;
       
+      // Final results replace any partial render still waiting for a frame
+      this.cancelProgressUpdate();
       this.filteredRecommendations = [...this.recommendations];
       this.renderRecommendations();
       
     } catch (error) {
+      // A newer run or deck change cancelled this one; it owns the display now
+      if (controller.signal.aborted) return;
       console.error('Error getting recommendations:', error);
+      this.cancelProgressUpdate();
       this.showRecommendationsError();
     } finally {
-      this.isLoading = false;
+      if (this.recommendationsController === controller) {
+        this.recommendationsController = null;
+        this.isLoading = false;
+      }
     }
   }
 
   private showProgressiveLoading(message: string): void {
+    this.partialResultsShown = 0;
     const list = this.element.querySelector('#recommendations-list');
     if (list) {
       list.innerHTML = `
@@ -381,18 +419,33 @@ export class AIRecommendationsTab extends BaseComponent {
     }
   }
 
+  private queueProgressUpdate(progress: { phase: string, count: number, total: number, recommendations: any[] }): void {
+    // Several phases can report within one frame; only the latest is worth painting
+    this.pendingProgress = progress;
+    if (this.progressFrame) return;
+
+    this.progressFrame = requestAnimationFrame(() => {
+      this.progressFrame = 0;
+      const latest = this.pendingProgress;
+      this.pendingProgress = null;
+      if (latest) this.showProgressiveResults(latest);
+    });
+  }
+
+  private cancelProgressUpdate(): void {
+    if (this.progressFrame) {
+      cancelAnimationFrame(this.progressFrame);
+      this.progressFrame = 0;
+    }
+    this.pendingProgress = null;
+  }
+
   private showProgressiveResults(progress: { phase: string, count: number, total: number, recommendations: any[] }): void {
     const list = this.element.querySelector('#recommendations-list');
     if (!list) return;
 
     const percentage = Math.round((progress.count / progress.total) * 100);
-    
-    // Update progress bar and phase
-    const phaseElement = list.querySelector('.loading-phase');
-    const progressBar = list.querySelector('.progress-bar') as HTMLElement;
-    
-    if (phaseElement) phaseElement.textContent = progress.phase;
-    if (progressBar) progressBar.style.width = `${percentage}%`;
+    const shown = Math.min(progress.recommendations.length, PARTIAL_RESULTS_SHOWN);
 
     // Show partial results if we have any
     if (progress.recommendations.length > 0) {
@@ -401,9 +454,15 @@ export class AIRecommendationsTab extends BaseComponent {
       
       // Reset pagination for progressive loading
       this.resetPagination();
-      
+    }
+
+    // Later phases only append, so once the first page is full the partial
+    // list is unchanged; rebuild it only when it actually grew
+    if (shown > 0 && shown !== this.partialResultsShown) {
+      this.partialResultsShown = shown;
+
       // Render partial results below the loading indicator
-      const partialResults = this.generateRecommendationsHTML(progress.recommendations.slice(0, 20)); // Show first 20
+      const partialResults = this.generateRecommendationsHTML(progress.recommendations.slice(0, PARTIAL_RESULTS_SHOWN));
       
       list.innerHTML = `
         <div class="progressive-loading">
@@ -416,11 +475,22 @@ export class AIRecommendationsTab extends BaseComponent {
           <p class="progress-text">${progress.count} of ${progress.total} found...</p>
         </div>
         <div class="partial-results">
-          <p><strong>Partial Results (showing first 20):</strong></p>
+          <p><strong>Partial Results (showing first ${PARTIAL_RESULTS_SHOWN}):</strong></p>
           ${partialResults}
         </div>
       `;
+      return;
     }
+
+    // Otherwise just move the progress indicators, skipping unchanged text
+    const phaseElement = list.querySelector('.loading-phase');
+    const progressBar = list.querySelector('.progress-bar') as HTMLElement;
+    const progressText = list.querySelector('.progress-text');
+    const countText = `${progress.count} of ${progress.total} found...`;
+    
+    if (phaseElement && phaseElement.textContent !== progress.phase) phaseElement.textContent = progress.phase;
+    if (progressBar) progressBar.style.width = `${percentage}%`;
+    if (progressText && progressText.textContent !== countText) progressText.textContent = countText;
   }
 
   private generateRecommendationsHTML(recommendations: any[]): string {
@@ -744,9 +814,8 @@ export class AIRecommendationsTab extends BaseComponent {
 
     // Handle view details - use delegation for better performance (works for both modes)
     // Remove any existing listeners to prevent duplicates
-    const existingHandler = (this as any)._viewDetailsHandler;
-    if (existingHandler) {
-      this.element.removeEventListener('click', existingHandler);
+    if (this.viewDetailsHandler !== null) {
+      this.element.removeEventListener('click', this.viewDetailsHandler);
     }
     
     const newHandler = (e: Event) => {
@@ -759,18 +828,12 @@ export class AIRecommendationsTab extends BaseComponent {
       }
     };
     
-    (this as any)._viewDetailsHandler = newHandler;
+    this.viewDetailsHandler = newHandler;
     this.element.addEventListener('click', newHandler);
   }
 
-  private async showCardDetails(cardName: string): Promise<void> {
-    // Lazy load CardDetailsModal
-    if (!this.cardDetailsModal) {
-      const { CardDetailsModal } = await import('./CardDetailsModal');
-      this.cardDetailsModal = new CardDetailsModal();
-    }
-    
-    this.cardDetailsModal.show(cardName);
+  private showCardDetails(cardName: string): void {
+    CardDetailsModal.shared().show(cardName);
   }
 
   private getCraftCost(costConsideration: string): string {
@@ -902,19 +965,28 @@ export class AIRecommendationsTab extends BaseComponent {
       loadMoreBtn.addEventListener('click', () => this.loadMoreRecommendations());
     }
 
-    // Also setup scroll-based infinite scroll
-    if (container) {
+    // Also setup scroll-based infinite scroll. The list container outlives
+    // each render, so the listener is attached only once.
+    if (container && !this.scrollListenerAttached) {
+      this.scrollListenerAttached = true;
+      let frame = 0;
+
       const scrollHandler = () => {
-        const scrollPosition = container.scrollTop + container.clientHeight;
-        const scrollHeight = container.scrollHeight;
-        
-        // Load more when scrolled to within 200px of bottom
-        if (scrollHeight - scrollPosition < 200 && !this.isLoadingMore) {
-          this.loadMoreRecommendations();
-        }
+        // Scroll fires many times per frame; measure layout once per frame
+        if (frame) return;
+        frame = requestAnimationFrame(() => {
+          frame = 0;
+          const scrollPosition = container.scrollTop + container.clientHeight;
+          const scrollHeight = container.scrollHeight;
+          
+          // Load more when scrolled to within 200px of bottom
+          if (scrollHeight - scrollPosition < 200 && !this.isLoadingMore) {
+            this.loadMoreRecommendations();
+          }
+        });
       };
 
-      container.addEventListener('scroll', scrollHandler);
+      container.addEventListener('scroll', scrollHandler, { passive: true });
     }
   }
 
@@ -923,14 +995,11 @@ export class AIRecommendationsTab extends BaseComponent {
       return;
     }
 
+    // Everything is already in memory, so reveal the next page right away
     this.isLoadingMore = true;
-    
-    // Simulate brief loading delay for better UX
-    setTimeout(() => {
-      this.displayedCount += this.loadMoreIncrement;
-      this.isLoadingMore = false;
-      this.renderRecommendations();
-    }, 300);
+    this.displayedCount += this.loadMoreIncrement;
+    this.renderRecommendations();
+    this.isLoadingMore = false;
   }
 
   private resetPagination(): void {
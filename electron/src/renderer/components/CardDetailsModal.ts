@@ -1,13 +1,68 @@
+import { CardCache, ScryfallAPI } from '../utils';
 import type { Card } from '../types';
 
+// Formats shown in the legality grid, with their display labels
+const LEGALITY_FORMATS: Array<[string, string]> = [
+  ['standard', 'Standard'],
+  ['pioneer', 'Pioneer'],
+  ['modern', 'Modern'],
+  ['legacy', 'Legacy'],
+  ['vintage', 'Vintage'],
+  ['commander', 'Commander']
+];
+
+// Scryfall legality status -> [css class, label]
+const LEGALITY_STATUS: Record<string, [string, string]> = {
+  legal: ['legal', 'Legal'],
+  not_legal: ['not-legal', 'Not legal'],
+  restricted: ['restricted', 'Restricted'],
+  banned: ['not-legal', 'Banned']
+};
+
+// The modal column is ~250px wide, so Scryfall's 'normal' size (488px) covers
+// 2x displays; never pull 'large'/'png'. Double-faced cards keep their images
+// under card_faces, and anything else goes straight to the image endpoint.
+function modalImageUrl(data: any): string {
+  const direct = data.image_uris?.normal || data.card_faces?.[0]?.image_uris?.normal;
+  if (direct) return direct;
+  if (!data.name) return '';
+  return `https://api.scryfall.com/cards/named?exact=${encodeURIComponent(data.name)}&format=image&version=normal`;
+}
+
+// Names remembered by prefetch() before the oldest are forgotten
+const MAX_PREFETCHED = 200;
+// Prefetches running at once, and waiting behind them
+const MAX_PREFETCH_IN_FLIGHT = 2;
+const MAX_PREFETCH_QUEUE = 8;
+// Cards after the opened one that prefetchAfter() warms
+const PREFETCH_AHEAD = 4;
+
 export class CardDetailsModal {
+  private static instance: CardDetailsModal | null = null;
+
   private modal: HTMLElement | null = null;
-  private isLoading = false;
+  private abortController: AbortController | null = null;
+  private requestId = 0;
+  // Lookups for the modal's fixed elements, filled on first use
+  private elements: Map<string, HTMLElement> = new Map();
+  // Cards already warmed by prefetch(), oldest first
+  private prefetched: Set<string> = new Set();
+  private prefetchQueue: string[] = [];
+  // Running prefetches, so they can be abandoned when the user opens a card
+  private prefetchesInFlight: Map<string, AbortController> = new Map();
 
   constructor() {
     this.createModal();
   }
 
+  // All tabs share one modal, created the first time a card is opened
+  static shared(): CardDetailsModal {
+    if (!CardDetailsModal.instance) {
+      CardDetailsModal.instance = new CardDetailsModal();
+    }
+    return CardDetailsModal.instance;
+  }
+
   private createModal(): void {
     const modal = document.createElement('div');
     modal.className = 'card-details-modal';
@@ -20,7 +75,7 @@ export class CardDetailsModal {
         <div class="card-details-body">
           <div class="card-details-left">
             <div class="card-image-container">
-              <img id="card-modal-image" class="card-modal-image" alt="Card Image" />
+              <img id="card-modal-image" class="card-modal-image" alt="Card Image" decoding="async" width="488" height="680" />
               <div class="card-image-loading" id="card-image-loading">
                 <div class="spinner"></div>
                 <p>Loading image...</p>
@@ -113,73 +168,183 @@ export class CardDetailsModal {
     modal.style.display = 'none';
   }
 
-  async show(cardName: string): Promise<void> {
-    if (this.isLoading || !this.modal) return;
+  // Resolves true only if this call filled the modal, i.e. it wasn't
+  // superseded by a newer show() or a close() while the data loaded
+  async show(cardName: string): Promise<boolean> {
+    if (!this.modal) return false;
+
+    // A newer click supersedes whatever is still in flight
+    this.abortController?.abort();
+    this.cancelPrefetches(cardName);
+    const controller = new AbortController();
+    this.abortController = controller;
+    const requestId = ++this.requestId;
 
-    this.isLoading = true;
     this.modal.style.display = 'flex';
 
     // Reset content
     this.resetContent();
     
     // Set initial title
-    const title = this.modal.querySelector('#card-modal-title');
+    const title = this.getElement('#card-modal-title');
     if (title) title.textContent = cardName;
 
     try {
-      const cardData = await this.fetchCardData(cardName);
+      const cardData = await this.fetchCardData(cardName, controller.signal);
+      // Ignore results for a card the user has already moved past
+      if (requestId !== this.requestId || controller.signal.aborted) return false;
+
       if (cardData) {
         this.populateCardData(cardData);
-      } else {
-        this.showError('Card not found');
+        return true;
       }
+      this.showError('Card not found');
+      return false;
     } catch (error) {
+      if (requestId !== this.requestId || controller.signal.aborted) return false;
       console.error('Error fetching card data:', error);
       this.showError('Error loading card data');
+      return false;
+    } finally {
+      if (this.abortController === controller) {
+        this.abortController = null;
+      }
     }
+  }
 
-    this.isLoading = false;
+  // Warm the data and full-size image for a card the user is about to open,
+  // so show() finds both in cache instead of starting from a cold request
+  prefetch(cardName: string): void {
+    if (this.prefetched.has(cardName)) return;
+    this.prefetched.add(cardName);
+    // Hovering across a large grid touches many names; only remember the
+    // most recent ones (older entries just get re-checked against the cache)
+    if (this.prefetched.size > MAX_PREFETCHED) {
+      const oldest = this.prefetched.values().next().value;
+      if (oldest !== undefined) this.prefetched.delete(oldest);
+    }
+
+    this.prefetchQueue.push(cardName);
+    // Sweeping across the grid queues faster than we fetch; drop the stalest
+    // (and let them be queued again on a later hover)
+    if (this.prefetchQueue.length > MAX_PREFETCH_QUEUE) {
+      const stale = this.prefetchQueue.shift();
+      if (stale !== undefined) this.prefetched.delete(stale);
+    }
+    this.pumpPrefetchQueue();
   }
 
-  private async fetchCardData(cardName: string): Promise<Card | null> {
-    try {
-      const encodedName = encodeURIComponent(cardName);
-      const response = await fetch(`https://api.scryfall.com/cards/named?exact=${encodedName}`);
-      
-      if (!response.ok) {
-        throw new Error(`HTTP error! status: ${response.status}`);
-      }
-      
-      const data = await response.json();
-      
-      // Transform Scryfall data to our Card interface
-      return {
-        id: data.id,
-        name: data.name,
-        manaCost: data.mana_cost || '',
-        cmc: data.cmc || 0,
-        typeLine: data.type_line || '',
-        oracleText: data.oracle_text || '',
-        colors: data.colors || [],
-        colorIdentity: data.color_identity || [],
-        power: data.power || '',
-        toughness: data.toughness || '',
-        rarity: data.rarity || '',
-        setCode: data.set || '',
-        setName: data.set_name || '',
-        collectorNumber: data.collector_number || '',
-        imageUri: data.image_uris?.normal || data.image_uris?.large || '',
-        scryfallId: data.id,
-        legalities: data.legalities || {},
-        prices: data.prices || {},
-        scryfallUri: data.scryfall_uri || ''
+  // Warm the next few cards after cards[index], the one just opened
+  prefetchAfter(cards: Array<{ name: string }>, index: number): void {
+    if (index === -1) return;
+    const ahead = cards.slice(index + 1, index + 1 + PREFETCH_AHEAD);
+    // The prefetch queue takes the newest entry first, so queue farthest first
+    for (let i = ahead.length - 1; i >= 0; i--) {
+      this.prefetch(ahead[i].name);
+    }
+  }
+
+  // A fixed number of prefetch workers drain the queue instead of every
+  // hover starting its own request and image download
+  private pumpPrefetchQueue(): void {
+    while (this.prefetchesInFlight.size < MAX_PREFETCH_IN_FLIGHT && this.prefetchQueue.length > 0) {
+      // Most recent hover first; it's the card most likely to be clicked
+      const cardName = this.prefetchQueue.pop()!;
+      const controller = new AbortController();
+      this.prefetchesInFlight.set(cardName, controller);
+      this.warmCard(cardName, controller.signal).finally(() => {
+        this.prefetchesInFlight.delete(cardName);
+        this.pumpPrefetchQueue();
+      });
+    }
+  }
+
+  private async warmCard(cardName: string, signal: AbortSignal): Promise<void> {
+    const card = await this.fetchCardData(cardName, signal);
+    if (!card || signal.aborted) {
+      this.prefetched.delete(cardName);
+      return;
+    }
+    if (!card.imageUri) return;
+
+    // Hold the worker until the image is in the HTTP cache; clearing the src
+    // on abort cancels the download
+    await new Promise<void>(resolve => {
+      const img = new Image();
+      const done = () => {
+        signal.removeEventListener('abort', abort);
+        resolve();
+      };
+      const abort = () => {
+        this.prefetched.delete(cardName);
+        img.removeAttribute('src');
+        done();
       };
+      img.onload = img.onerror = done;
+      signal.addEventListener('abort', abort);
+      img.src = card.imageUri!;
+    });
+  }
+
+  // Opening a card (or leaving the grid) makes queued and running prefetches
+  // moot; stop them so they stop using bandwidth
+  public cancelPrefetches(keep?: string): void {
+    for (const cardName of this.prefetchQueue) {
+      this.prefetched.delete(cardName);
+    }
+    this.prefetchQueue = [];
+
+    for (const [cardName, controller] of this.prefetchesInFlight) {
+      if (cardName !== keep) controller.abort();
+    }
+  }
+
+  private async fetchCardData(cardName: string, signal?: AbortSignal): Promise<Card | null> {
+    // Cards warmed by the deck/collection prefetch open without a network trip.
+    // Prices expire sooner than card data, so only use the cache when both are fresh.
+    const cached = CardCache.getCardData(cardName);
+    const cachedPrices = cached ? CardCache.getPriceData(cardName) : null;
+    if (cached && cachedPrices) {
+      return this.toCard({ ...cached, prices: cachedPrices });
+    }
+
+    try {
+      // Stale or missing prices: fetch fresh through the shared client, which
+      // caches card data and prices separately
+      const data = await ScryfallAPI.getCardByName(cardName, true, signal);
+      return data ? this.toCard(data) : null;
     } catch (error) {
+      if (signal?.aborted) return null;
       console.error('Error fetching from Scryfall:', error);
       return null;
     }
   }
 
+  // Transform Scryfall data to our Card interface
+  private toCard(data: any): Card {
+    return {
+      id: data.id,
+      name: data.name,
+      manaCost: data.mana_cost || '',
+      cmc: data.cmc || 0,
+      typeLine: data.type_line || '',
+      oracleText: data.oracle_text || '',
+      colors: data.colors || [],
+      colorIdentity: data.color_identity || [],
+      power: data.power || '',
+      toughness: data.toughness || '',
+      rarity: data.rarity || '',
+      setCode: data.set || '',
+      setName: data.set_name || '',
+      collectorNumber: data.collector_number || '',
+      imageUri: modalImageUrl(data),
+      scryfallId: data.id,
+      legalities: data.legalities || {},
+      prices: data.prices || {},
+      scryfallUri: data.scryfall_uri || ''
+    };
+  }
+
   private populateCardData(card: Card): void {
     if (!this.modal) return;
 
@@ -209,7 +374,7 @@ export class CardDetailsModal {
     this.populatePricing(card.prices || {});
 
     // Scryfall link
-    const scryfallBtn = this.modal.querySelector('#view-on-scryfall') as HTMLButtonElement;
+    const scryfallBtn = this.getElement<HTMLButtonElement>('#view-on-scryfall');
     if (scryfallBtn && card.scryfallUri) {
       scryfallBtn.onclick = () => window.electronAPI?.shell?.openExternal(card.scryfallUri!);
     }
@@ -218,51 +383,52 @@ export class CardDetailsModal {
   private loadCardImage(imageUri: string): void {
     if (!this.modal || !imageUri) return;
 
-    const img = this.modal.querySelector('#card-modal-image') as HTMLImageElement;
-    const loading = this.modal.querySelector('#card-image-loading') as HTMLElement;
+    const img = this.getElement<HTMLImageElement>('#card-modal-image');
+    const loading = this.getElement('#card-image-loading');
 
     if (!img || !loading) return;
 
     loading.style.display = 'flex';
     img.style.display = 'none';
 
-    img.onload = () => {
+    // decode() fetches and decodes off the main thread; the image is only
+    // swapped in once it's ready to paint, so showing it never janks
+    const requestId = this.requestId;
+    img.src = imageUri;
+    img.decode().then(() => {
+      if (requestId !== this.requestId) return;
       loading.style.display = 'none';
       img.style.display = 'block';
-    };
-
-    img.onerror = () => {
+    }).catch(() => {
+      // decode() also rejects when a newer card replaced the src mid-load
+      if (requestId !== this.requestId) return;
       loading.innerHTML = '<p>Failed to load image</p>';
-    };
-
-    img.src = imageUri;
+    });
   }
 
   private populateLegalities(legalities: any): void {
     if (!this.modal) return;
 
-    const grid = this.modal.querySelector('#modal-legality-grid');
+    const grid = this.getElement('#modal-legality-grid');
     if (!grid) return;
 
-    const formats = ['standard', 'pioneer', 'modern', 'legacy', 'vintage', 'commander'];
-    
-    grid.innerHTML = formats.map(format => {
+    const parts: string[] = [];
+    for (const [format, label] of LEGALITY_FORMATS) {
       const status = legalities[format] || 'not_legal';
-      const statusClass = status === 'legal' ? 'legal' : status === 'restricted' ? 'restricted' : 'not-legal';
-      
-      return `
-        <div class="legality-item">
-          <span class="format-name">${this.capitalizeFirst(format)}:</span>
-          <span class="legality-status ${statusClass}">${this.capitalizeFirst(status.replace('_', ' '))}</span>
-        </div>
-      `;
-    }).join('');
+      const [statusClass, statusLabel] = LEGALITY_STATUS[status] || LEGALITY_STATUS.not_legal;
+      parts.push(
+        `<div class="legality-item"><span class="format-name">${label}:</span>` +
+        `<span class="legality-status ${statusClass}">${statusLabel}</span></div>`
+      );
+    }
+
+    grid.innerHTML = parts.join('');
   }
 
   private populatePricing(prices: any): void {
     if (!this.modal) return;
 
-    const pricingInfo = this.modal.querySelector('#modal-pricing-info');
+    const pricingInfo = this.getElement('#modal-pricing-info');
     if (!pricingInfo) return;
 
     const priceTypes = [
@@ -304,8 +470,8 @@ export class CardDetailsModal {
     this.setTextContent('#modal-pricing-info', 'Loading...');
 
     // Reset image
-    const img = this.modal.querySelector('#card-modal-image') as HTMLImageElement;
-    const loading = this.modal.querySelector('#card-image-loading') as HTMLElement;
+    const img = this.getElement<HTMLImageElement>('#card-modal-image');
+    const loading = this.getElement('#card-image-loading');
     if (img && loading) {
       img.style.display = 'none';
       loading.style.display = 'flex';
@@ -322,8 +488,18 @@ export class CardDetailsModal {
   }
 
   private setTextContent(selector: string, text: string): void {
-    const element = this.modal?.querySelector(selector);
-    if (element) element.textContent = text;
+    const element = this.getElement(selector);
+    if (element && element.textContent !== text) element.textContent = text;
+  }
+
+  private getElement<T extends HTMLElement = HTMLElement>(selector: string): T | null {
+    let element = this.elements.get(selector);
+    if (!element) {
+      element = this.modal?.querySelector<HTMLElement>(selector) || undefined;
+      if (!element) return null;
+      this.elements.set(selector, element);
+    }
+    return element as T;
   }
 
   private capitalizeFirst(str: string): string {
@@ -331,15 +507,32 @@ export class CardDetailsModal {
   }
 
   close(): void {
+    // Don't keep downloading data for a modal nobody is looking at
+    this.abortController?.abort();
+    this.abortController = null;
+
+    // Stale-out pending decode callbacks and drop the src, which cancels an
+    // image that is still downloading
+    this.requestId++;
+    this.getElement<HTMLImageElement>('#card-modal-image')?.removeAttribute('src');
+
     if (this.modal) {
       this.modal.style.display = 'none';
     }
   }
 
   destroy(): void {
+    this.abortController?.abort();
+    this.abortController = null;
+
     if (this.modal) {
       this.modal.remove();
       this.modal = null;
+      this.elements.clear();
+    }
+
+    if (CardDetailsModal.instance === this) {
+      CardDetailsModal.instance = null;
     }
   }
 }
@@ -1,18 +1,39 @@
 import { BaseComponent } from './BaseComponent';
 import { CardDetailsModal } from './CardDetailsModal';
+import { CardCache, CSVHandler, ScryfallAPI } from '../utils';
 import type { Card, Collection } from '../types';
 
+const IMAGE_URL_PREFIX = 'https://api.scryfall.com/cards/named?exact=';
+const IMAGE_URL_SUFFIX = '&format=image&version=small';
+const CDN_SIZE_SEGMENT = /\/(normal|large)\//;
+// Cards rendered per grid chunk
+const RENDER_CHUNK_SIZE = 60;
+// Resolved image URLs kept in memory; least recently used are dropped first
+const IMAGE_URL_CACHE_LIMIT = 3000;
+// Primary card types, checked in this order
+const PRIMARY_TYPES = ['Creature', 'Instant', 'Sorcery', 'Enchantment', 'Artifact', 'Planeswalker', 'Land', 'Battle'];
+// Fields describing the user's own printing; a refresh only fills them in
+// when they're missing, since Scryfall answers with its default printing
+const PRINTING_FIELDS = ['setCode', 'setName', 'collectorNumber', 'rarity', 'typeLine', 'manaCost', 'scryfallId'] as const;
+
 export class CollectionTab extends BaseComponent {
   private collection: Collection = { cards: [], lastModified: new Date().toISOString() };
   private filteredCards: Card[] = [];
   private searchTimeout: number = 0;
-  private cardModal: CardDetailsModal;
   private selectionMode: boolean = false;
   private selectedCards: Set<string> = new Set();
+  private imageUrlCache: Map<string, string> = new Map();
+  private renderToken = 0;
+  private hoverPrefetchTimeout = 0;
+  private statusTimeout = 0;
+  private statusFrame = 0;
+  private cardDetailsRequest = 0;
+  private suggestionController: AbortController | null = null;
+  private displayedSuggestions = '';
+  private onCollectionChange: ((collection: Collection) => void) | null = null;
 
   constructor() {
     super('#collection-tab');
-    this.cardModal = new CardDetailsModal();
   }
 
   initialize(): void {
@@ -229,10 +250,34 @@ export class CollectionTab extends BaseComponent {
       this.clearAllFilters();
     });
 
+    // Prefetch a card's details once the pointer settles on its tile
+    this.setupHoverPrefetch();
+
     // Action buttons - using onclick handlers for reliability
     console.log('CollectionTab event listeners setup complete');
   }
 
+  private setupHoverPrefetch(): void {
+    const grid = this.element.querySelector('#collection-grid');
+    if (!grid) return;
+
+    grid.addEventListener('mouseover', (e) => {
+      const tile = (e.target as HTMLElement).closest('.card-item') as HTMLElement | null;
+      if (!tile || tile.contains(e.relatedTarget as Node)) return;
+
+      clearTimeout(this.hoverPrefetchTimeout);
+      this.hoverPrefetchTimeout = window.setTimeout(() => {
+        const card = this.collection.cards.find(c => c.id === tile.dataset.cardId);
+        if (card) CardDetailsModal.shared().prefetch(card.name);
+      }, 150);
+    });
+
+    grid.addEventListener('mouseleave', () => {
+      clearTimeout(this.hoverPrefetchTimeout);
+      CardDetailsModal.shared().cancelPrefetches();
+    });
+  }
+
   private setupColorFilters(): void {
     // Set up color checkbox filters with proper event delegation
     const colorCheckboxes = this.element.querySelectorAll('.color-checkbox input[type="checkbox"]');
@@ -305,6 +350,13 @@ export class CollectionTab extends BaseComponent {
     this.collection = collection;
     this.filteredCards = [...collection.cards];
     this.applyFilters();
+    if (this.onCollectionChange) {
+      this.onCollectionChange(collection);
+    }
+  }
+
+  setOnCollectionChange(callback: (collection: Collection) => void): void {
+    this.onCollectionChange = callback;
   }
 
   private renderCards(): void {
@@ -312,6 +364,7 @@ export class CollectionTab extends BaseComponent {
     if (!grid) return;
 
     if (this.filteredCards.length === 0) {
+      this.renderToken++;
       grid.innerHTML = `
         <div class="empty-state">
           <p>No cards match your current filters</p>
@@ -319,68 +372,152 @@ export class CollectionTab extends BaseComponent {
         </div>
       `;
     } else {
-      grid.innerHTML = this.filteredCards.map(card => {
-        const imageUrl = this.getCardImageUrl(card.name);
-        const isSelected = this.selectedCards.has(card.id);
-        const selectionClass = isSelected ? 'selected' : '';
-        const selectionModeClass = this.selectionMode ? 'selection-mode' : '';
-        
-        return `
-          <div class="card-item ${selectionClass} ${selectionModeClass}" data-card-id="${card.id}">
-            ${this.selectionMode ? `
-              <div class="card-checkbox-wrapper">
-                <input type="checkbox" class="card-checkbox" data-card-id="${card.id}" ${isSelected ? 'checked' : ''} 
-                       onclick="event.stopPropagation(); window.app?.components?.collection?.toggleCardSelection?.('${card.id}');" />
-              </div>
-            ` : ''}
-            <div class="card-content" onclick="window.app?.components?.collection?.${this.selectionMode ? `toggleCardSelection?.('${card.id}')` : `showCardDetails?.('${card.id}')`};">
-              <div class="card-image-container">
-                ${imageUrl ? 
-                  `<img class="card-image" src="${imageUrl}" alt="${card.name}" 
-                       onerror="this.style.display='none'; this.nextElementSibling.style.display='flex';" />
-                   <div class="card-image-placeholder" style="display: none;">
-                     <div class="placeholder-content">
-                       <span class="placeholder-icon">🃏</span>
-                       <span class="placeholder-text">${card.name}</span>
-                     </div>
-                   </div>` : 
-                  `<div class="card-image-placeholder">
-                     <div class="placeholder-content">
-                       <span class="placeholder-icon">🃏</span>
-                       <span class="placeholder-text">${card.name}</span>
-                     </div>
-                   </div>`}
-              </div>
-              <div class="card-info">
-                <div class="card-name" title="${card.name}">${card.name}</div>
-                <div class="card-type" title="${card.typeLine || ''}">${card.typeLine || 'Unknown'}</div>
-                <div class="card-meta">
-                  <span class="card-rarity ${card.rarity || 'common'}">${this.formatRarity(card.rarity || 'common')}</span>
-                  <span class="card-quantity">×${card.quantity || 1}</span>
-                  ${card.manaCost ? `<span class="mana-cost" title="Mana Cost">${card.manaCost}</span>` : ''}
-                </div>
-                ${card.colors && card.colors.length > 0 ? 
-                  `<div class="card-colors">
-                     ${card.colors.map(color => `<span class="color-pip color-${color.toLowerCase()}">${color}</span>`).join('')}
-                   </div>` : ''}
-              </div>
-            </div>
-          </div>
-        `;
-      }).join('');
+      // Paint the first screenful now and append the rest in idle slots,
+      // so large collections don't block input while the grid builds
+      const cards = this.filteredCards;
+      const renderToken = ++this.renderToken;
+      grid.innerHTML = cards.slice(0, RENDER_CHUNK_SIZE).map(card => this.renderCardItem(card)).join('');
+      if (cards.length > RENDER_CHUNK_SIZE) {
+        this.appendCardsWhenIdle(grid, cards, RENDER_CHUNK_SIZE, renderToken);
+      }
     }
 
     // Re-bind any additional event listeners needed for the rendered cards
     this.bindCardEvents();
   }
 
-  private getCardImageUrl(cardName: string): string | null {
+  private appendCardsWhenIdle(grid: Element, cards: Card[], start: number, renderToken: number): void {
+    requestIdleCallback(deadline => {
+      // A newer render replaced this grid; drop the remaining chunks
+      if (renderToken !== this.renderToken) return;
+
+      let index = start;
+      do {
+        const end = Math.min(index + RENDER_CHUNK_SIZE, cards.length);
+        grid.insertAdjacentHTML('beforeend', cards.slice(index, end).map(card => this.renderCardItem(card)).join(''));
+        index = end;
+      } while (index < cards.length && deadline.timeRemaining() > 5);
+
+      if (index < cards.length) {
+        this.appendCardsWhenIdle(grid, cards, index, renderToken);
+      }
+    }, { timeout: 200 });
+  }
+
+  private renderCardItem(card: Card): string {
+    const imageUrl = this.getCardImageUrl(card);
+    const isSelected = this.selectedCards.has(card.id);
+    const selectionClass = isSelected ? 'selected' : '';
+    const selectionModeClass = this.selectionMode ? 'selection-mode' : '';
+    
+    return `
+      <div class="card-item ${selectionClass} ${selectionModeClass}" data-card-id="${card.id}">
+        ${this.selectionMode ? `
+          <div class="card-checkbox-wrapper">
+            <input type="checkbox" class="card-checkbox" data-card-id="${card.id}" ${isSelected ? 'checked' : ''} 
+                   onclick="event.stopPropagation(); window.app?.components?.collection?.toggleCardSelection?.('${card.id}');" />
+          </div>
+        ` : ''}
+        <div class="card-content" onclick="window.app?.components?.collection?.${this.selectionMode ? `toggleCardSelection?.('${card.id}')` : `showCardDetails?.('${card.id}')`};">
+          <div class="card-image-container">
+            ${imageUrl ? 
+              `<img class="card-image" src="${imageUrl}" alt="${card.name}" loading="lazy" decoding="async" 
+                   onerror="this.style.display='none'; this.nextElementSibling.style.display='flex';" />
+               <div class="card-image-placeholder" style="display: none;">
+                 <div class="placeholder-content">
+                   <span class="placeholder-icon">🃏</span>
+                   <span class="placeholder-text">${card.name}</span>
+                 </div>
+               </div>` : 
+              `<div class="card-image-placeholder">
+                 <div class="placeholder-content">
+                   <span class="placeholder-icon">🃏</span>
+                   <span class="placeholder-text">${card.name}</span>
+                 </div>
+               </div>`}
+          </div>
+          <div class="card-info">
+            <div class="card-name" title="${card.name}">${card.name}</div>
+            <div class="card-type" title="${card.typeLine || ''}">${card.typeLine || 'Unknown'}</div>
+            <div class="card-meta">
+              <span class="card-rarity ${card.rarity || 'common'}">${this.formatRarity(card.rarity || 'common')}</span>
+              <span class="card-quantity">×${card.quantity || 1}</span>
+              ${card.manaCost ? `<span class="mana-cost" title="Mana Cost">${card.manaCost}</span>` : ''}
+            </div>
+            ${card.colors && card.colors.length > 0 ? 
+              `<div class="card-colors">
+                 ${card.colors.map(color => `<span class="color-pip color-${color.toLowerCase()}">${color}</span>`).join('')}
+               </div>` : ''}
+          </div>
+        </div>
+      </div>
+    `;
+  }
+
+  private getCardImageUrl(card: Card): string | null {
+    const cardName = card.name;
     if (!cardName) return null;
     
-    // Use Scryfall's image API - this will get the small image for performance
+    // Every filter/search re-renders the grid, so resolve each name only once
+    const cached = this.imageUrlCache.get(cardName);
+    if (cached) {
+      // Re-insert so Map order tracks recency
+      this.imageUrlCache.delete(cardName);
+      this.imageUrlCache.set(cardName, cached);
+      return cached;
+    }
+
+    // Prefer Scryfall's pre-sized 'small' image straight from the CDN when we
+    // know it - no API request, no redirect, and no oversized download
+    const cachedData = card.imageUri ? null : CardCache.getCardData(cardName);
+    const cdnUrl = card.imageUri
+      ? card.imageUri.replace(CDN_SIZE_SEGMENT, '/small/')
+      : cachedData?.image_uris?.small || cachedData?.card_faces?.[0]?.image_uris?.small;
+
+    // Otherwise fall back to Scryfall's image API, which redirects to the small image
     // Format: https://api.scryfall.com/cards/named?exact={name}&format=image&version=small
-    const encodedName = encodeURIComponent(cardName);
-    return `https://api.scryfall.com/cards/named?exact=${encodedName}&format=image&version=small`;
+    const url = cdnUrl || IMAGE_URL_PREFIX + encodeURIComponent(cardName) + IMAGE_URL_SUFFIX;
+    this.imageUrlCache.set(cardName, url);
+    if (this.imageUrlCache.size > IMAGE_URL_CACHE_LIMIT) {
+      const oldest = this.imageUrlCache.keys().next().value;
+      if (oldest !== undefined) this.imageUrlCache.delete(oldest);
+    }
+    return url;
+  }
+
+  // Look up (in batches) the cards still using the API image redirect, so
+  // their direct CDN URLs end up in the persistent card cache
+  private async resolveFallbackImages(): Promise<void> {
+    const pending: Card[] = [];
+    for (const card of this.collection.cards) {
+      const url = this.getCardImageUrl(card);
+      if (url?.startsWith(IMAGE_URL_PREFIX)) pending.push(card);
+    }
+    if (pending.length === 0) return;
+
+    try {
+      // A few pooled batch requests instead of one API redirect per tile
+      const found = await ScryfallAPI.getCardsByNames(pending.map(card => card.name));
+      if (found.size === 0) return;
+
+      // Swap the resolved URLs into the tiles already on screen rather than
+      // rebuilding the grid; chunks not appended yet pick them up from the memo
+      const images = new Map<string, HTMLImageElement>();
+      this.element.querySelectorAll('#collection-grid .card-item').forEach(item => {
+        const id = (item as HTMLElement).dataset.cardId;
+        const img = item.querySelector('.card-image') as HTMLImageElement | null;
+        if (id && img) images.set(id, img);
+      });
+      for (const card of pending) {
+        if (!found.has(card.name.toLowerCase())) continue;
+        this.imageUrlCache.delete(card.name);
+        const url = this.getCardImageUrl(card);
+        const img = images.get(card.id);
+        if (img && url && img.src !== url) img.src = url;
+      }
+    } catch (error) {
+      console.error('Error resolving card images:', error);
+    }
   }
 
   private formatRarity(rarity: string): string {
@@ -405,8 +542,13 @@ export class CollectionTab extends BaseComponent {
 
     console.log('Showing card details for:', card.name);
     
-    // Open the card details modal
-    this.cardModal.show(card.name);
+    // Open the card details modal, then warm the next few cards in grid
+    // order once the opened one has its data (and is still the one showing)
+    const modal = CardDetailsModal.shared();
+    const index = this.filteredCards.indexOf(card);
+    modal.show(card.name).then(shown => {
+      if (shown) modal.prefetchAfter(this.filteredCards, index);
+    });
   }
 
   private updateStats(): void {
@@ -419,16 +561,32 @@ export class CollectionTab extends BaseComponent {
     const totalElement = this.element.querySelector('#sidebar-total-cards');
     if (totalElement) totalElement.textContent = this.filteredCards.length.toString();
     
-    const uniqueCards = new Set(this.filteredCards.map(card => card.name)).size;
+    // One pass over the filtered cards, reading each field once per card
+    const names = new Set<string>();
+    const rarityCount = { common: 0, uncommon: 0, rare: 0, mythic: 0 };
+    let collectionValue = 0;
+    for (const card of this.filteredCards) {
+      names.add(card.name);
+      const rarity = card.rarity;
+      // Basic price estimation based on rarity (simplified calculation)
+      let priceEstimate = 0.10;
+      if (rarity === 'mythic') {
+        rarityCount.mythic++;
+        priceEstimate = 5.00;
+      } else if (rarity === 'rare') {
+        rarityCount.rare++;
+        priceEstimate = 1.50;
+      } else if (rarity === 'uncommon') {
+        rarityCount.uncommon++;
+        priceEstimate = 0.25;
+      } else if (rarity === 'common') {
+        rarityCount.common++;
+      }
+      collectionValue += priceEstimate * (card.quantity ?? 1);
+    }
+
     const uniqueElement = this.element.querySelector('#sidebar-unique-cards');
-    if (uniqueElement) uniqueElement.textContent = uniqueCards.toString();
-    
-    const rarityCount = {
-      common: this.filteredCards.filter(card => card.rarity === 'common').length,
-      uncommon: this.filteredCards.filter(card => card.rarity === 'uncommon').length,
-      rare: this.filteredCards.filter(card => card.rarity === 'rare').length,
-      mythic: this.filteredCards.filter(card => card.rarity === 'mythic').length
-    };
+    if (uniqueElement) uniqueElement.textContent = names.size.toString();
     
     const commonsElement = this.element.querySelector('#sidebar-commons');
     if (commonsElement) commonsElement.textContent = rarityCount.common.toString();
@@ -442,16 +600,6 @@ export class CollectionTab extends BaseComponent {
     const mythicsElement = this.element.querySelector('#sidebar-mythics');
     if (mythicsElement) mythicsElement.textContent = rarityCount.mythic.toString();
     
-    // Calculate collection value (simplified calculation)
-    const collectionValue = this.filteredCards.reduce((total, card) => {
-      // Basic price estimation based on rarity
-      const priceEstimate = card.rarity === 'mythic' ? 5.00 :
-                           card.rarity === 'rare' ? 1.50 :
-                           card.rarity === 'uncommon' ? 0.25 : 0.10;
-      const quantity = card.quantity ?? 1;
-      return total + (priceEstimate * quantity);
-    }, 0);
-    
     const valueElement = this.element.querySelector('#sidebar-collection-value');
     if (valueElement) valueElement.textContent = `$${collectionValue.toFixed(2)}`;
   }
@@ -546,9 +694,7 @@ export class CollectionTab extends BaseComponent {
   }
 
   private extractPrimaryType(typeLine: string): string {
-    const types = ['Creature', 'Instant', 'Sorcery', 'Enchantment', 'Artifact', 'Planeswalker', 'Land', 'Battle'];
-    
-    for (const type of types) {
+    for (const type of PRIMARY_TYPES) {
       if (typeLine.includes(type)) {
         return type;
       }
@@ -571,21 +717,20 @@ export class CollectionTab extends BaseComponent {
       if (result && !result.canceled && result.filePaths.length > 0) {
         const filePath = result.filePaths[0];
         console.log('Selected CSV file:', filePath);
+        ScryfallAPI.preconnect();
         
-        // Read and parse CSV file
-        // For now, we'll use a simple implementation
-        // In a real app, you'd want to use the Node.js fs module via IPC
+        // Read the file via IPC to the main process, then parse it
         this.showImportStatus('Reading CSV file...');
-        
-        // TODO: Implement actual CSV parsing
-        // This would involve:
-        // 1. Reading the file via IPC to main process
-        // 2. Parsing CSV content
-        // 3. Creating Card objects
-        // 4. Adding to collection
-        // 5. Updating UI
-        
-        this.showImportStatus('CSV import completed!');
+        const csvText: string = await window.electronAPI.readTextFile(filePath);
+        const entries = CSVHandler.parseCollectionCSV(csvText);
+        if (entries.length === 0) {
+          this.showImportStatus('No cards found in CSV file');
+          return;
+        }
+
+        this.showImportStatus('Processing CSV file...');
+        const addedCards = await this.addImportedCards(entries, 'csv');
+        this.showImportStatus(`Added ${addedCards} cards from CSV`);
       }
     } catch (error) {
       console.error('Error importing CSV:', error);
@@ -626,6 +771,8 @@ export class CollectionTab extends BaseComponent {
 
   private async importClipboard(): Promise<void> {
     try {
+      ScryfallAPI.preconnect();
+
       // Get clipboard text
       const clipboardText = await navigator.clipboard.readText();
       
@@ -636,54 +783,59 @@ export class CollectionTab extends BaseComponent {
 
       this.showImportStatus('Processing clipboard content...');
       
-      // Parse clipboard content as card list
-      const lines = clipboardText.split('\n').filter(line => line.trim());
-      let addedCards = 0;
+      // Parse clipboard content as card list: "4 Lightning Bolt" or "Lightning Bolt".
+      // The collection has no sideboard, so a card in both sections is one row.
+      const entries = CSVHandler.parseDeckList(clipboardText, true, true);
+
+      const addedCards = await this.addImportedCards(entries, 'clipboard');
+      this.showImportStatus(`Added ${addedCards} cards from clipboard`);
       
-      for (const line of lines) {
-        const trimmed = line.trim();
-        if (!trimmed) continue;
-        
-        // Parse format: "4 Lightning Bolt" or "Lightning Bolt"
-        const match = trimmed.match(/^(\d+)\s+(.+)$/) || [null, '1', trimmed];
-        const quantity = parseInt(match[1] || '1');
-        const cardName = (match[2] || trimmed).trim();
-        
-        if (cardName) {
-          // Create basic card object
-          const newCard: Card = {
-            id: `clipboard-${Date.now()}-${addedCards}`,
-            name: cardName,
+    } catch (error) {
+      console.error('Error importing from clipboard:', error);
+      this.showImportStatus('Error reading clipboard');
+    }
+  }
+
+  // Resolve imported names with a few batched lookups, add them to the
+  // collection and save. Returns how many cards were added.
+  private async addImportedCards(entries: Array<{name: string, quantity: number}>, source: string): Promise<number> {
+    let found = new Map<string, any>();
+    try {
+      found = await ScryfallAPI.resolveCardNames(entries.map(entry => entry.name));
+    } catch (error) {
+      console.error(`Error resolving ${source} cards:`, error);
+    }
+
+    let addedCards = 0;
+    const stamp = Date.now();
+    for (const entry of entries) {
+      const data = found.get(entry.name.toLowerCase());
+      const id = `${source}-${stamp}-${addedCards}`;
+      const newCard: Card = data
+        ? { ...ScryfallAPI.transformScryfallCard(data), id, quantity: entry.quantity }
+        : {
+            // Create basic card object
+            id,
+            name: entry.name,
             typeLine: 'Unknown',
             manaCost: '',
             colors: [],
             rarity: 'common',
-            quantity: quantity
+            quantity: entry.quantity
           };
-          
-          this.collection.cards.push(newCard);
-          addedCards++;
-        }
-      }
-      
-      // Update UI
-      this.setCollection(this.collection);
-      this.showImportStatus(`Added ${addedCards} cards from clipboard`);
       
-      // Save to persistent storage
-      await this.saveCollection();
-      
-    } catch (error) {
-      console.error('Error importing from clipboard:', error);
-      this.showImportStatus('Error reading clipboard');
+      this.collection.cards.push(newCard);
+      addedCards++;
     }
+    
+    // Update UI, then save to persistent storage
+    this.setCollection(this.collection);
+    await this.saveCollection();
+    return addedCards;
   }
 
   private async refreshCardData(): Promise<void> {
     try {
-      // Dynamically import CardCache
-      const { CardCache, ScryfallAPI } = await import('../utils');
-      
       // Get cache stats before
       const statsBefore = CardCache.getCacheStats();
       
@@ -701,23 +853,34 @@ export class CollectionTab extends BaseComponent {
       // Invalidate all caches to force refresh
       CardCache.invalidateCache();
       
-      let updatedCount = 0;
       const uniqueCards = Array.from(new Set(this.collection.cards.map(c => c.name)));
       
-      for (const cardName of uniqueCards) {
-        try {
-          // Force refresh by fetching with forceRefresh flag
-          await ScryfallAPI.getCardByName(cardName, true);
-          updatedCount++;
-          
-          // Update status periodically
-          if (updatedCount % 10 === 0) {
-            this.showImportStatus(`Updating... ${updatedCount}/${uniqueCards.length} cards`);
-          }
-        } catch (error) {
-          console.error(`Error updating ${cardName}:`, error);
-        }
-      }
+      // Resolve the whole collection in batches of 75 rather than one request per card
+      // Batches finish in bursts; paint only the latest count once per frame
+      let progressText = '';
+      const refreshed = await ScryfallAPI.getCardsByNames(uniqueCards, true, (done, total) => {
+        progressText = `Updating... ${done}/${total} cards`;
+        if (this.statusFrame) return;
+        this.statusFrame = requestAnimationFrame(() => {
+          this.statusFrame = 0;
+          this.showImportStatus(progressText);
+        });
+      });
+      cancelAnimationFrame(this.statusFrame);
+      this.statusFrame = 0;
+      const updatedCount = refreshed.size;
+      
+      // Apply the resolved data to every collection entry in one pass, keeping
+      // each entry's own id, quantity and printing, then re-filter and save once
+      this.collection.cards = this.collection.cards.map(card => {
+        const data = refreshed.get(card.name.toLowerCase());
+        return data ? this.mergeRefreshedCard(card, data) : card;
+      });
+      
+      // Refreshed data may carry direct image URLs for cards that used the API fallback
+      this.imageUrlCache.clear();
+      this.setCollection(this.collection);
+      await this.saveCollection();
       
       // Get cache stats after
       const statsAfter = CardCache.getCacheStats();
@@ -732,6 +895,20 @@ export class CollectionTab extends BaseComponent {
     }
   }
 
+  // Oracle data, prices and legalities come from Scryfall; printing fields
+  // (and the image, for a different printing) stay as the user has them
+  private mergeRefreshedCard(card: Card, data: any): Card {
+    const merged: Card = { ...card, ...ScryfallAPI.transformScryfallCard(data), id: card.id, quantity: card.quantity };
+    for (const field of PRINTING_FIELDS) {
+      const value = card[field];
+      if (value && value !== 'Unknown') merged[field] = value;
+    }
+    if (card.scryfallId && card.scryfallId !== data.id && card.imageUri) {
+      merged.imageUri = card.imageUri;
+    }
+    return merged;
+  }
+
   private addCard(): void {
     // Create modal HTML
     const modalHtml = `
@@ -779,8 +956,8 @@ export class CollectionTab extends BaseComponent {
     const cancelBtn = document.getElementById('cancel-add-card') as HTMLButtonElement;
     const nameInput = document.getElementById('card-name-input') as HTMLInputElement;
 
-    // Focus on card name input
-    setTimeout(() => nameInput?.focus(), 100);
+    // The modal is shown synchronously above, so the input can take focus now
+    nameInput?.focus();
 
     // Set up autocomplete
     this.setupCardNameAutocomplete(nameInput);
@@ -801,22 +978,46 @@ export class CollectionTab extends BaseComponent {
     if (!input) return;
 
     let searchTimeout: number;
+    let lastQuery = '';
     const suggestionsContainer = document.getElementById('card-suggestions') as HTMLElement;
     
     input.addEventListener('input', () => {
-      clearTimeout(searchTimeout);
       const query = input.value.trim();
+      // Edits that only touch surrounding whitespace don't change the search;
+      // leave the pending timer, request or shown list alone
+      if (query === lastQuery) return;
+      lastQuery = query;
+
+      clearTimeout(searchTimeout);
+      // Whatever is still in flight is for an older query now
+      this.suggestionController?.abort();
+      this.suggestionController = null;
       
       if (query.length < 2) {
         this.hideSuggestions(suggestionsContainer);
         return;
       }
 
-      searchTimeout = window.setTimeout(async () => {
-        await this.fetchCardSuggestions(query, suggestionsContainer, input);
+      // Typing on from a query we already have the answer for needs neither
+      // the debounce nor a request
+      const cached = ScryfallAPI.getCachedAutocomplete(query);
+      if (cached) {
+        this.showSuggestionResults(cached, suggestionsContainer, input);
+        return;
+      }
+
+      searchTimeout = window.setTimeout(() => {
+        const controller = new AbortController();
+        this.suggestionController = controller;
+        this.fetchCardSuggestions(query, suggestionsContainer, input, controller.signal);
       }, 300);
     });
 
+    suggestionsContainer?.addEventListener('click', (e) => {
+      const item = (e.target as HTMLElement).closest('.suggestion-item');
+      if (item) this.selectSuggestion(item.textContent || '', suggestionsContainer, input);
+    });
+
     // Handle keyboard navigation
     input.addEventListener('keydown', (e) => {
       this.handleSuggestionNavigation(e, suggestionsContainer, input);
@@ -830,39 +1031,47 @@ export class CollectionTab extends BaseComponent {
     });
   }
 
-  private async fetchCardSuggestions(query: string, container: HTMLElement, input: HTMLInputElement): Promise<void> {
+  private async fetchCardSuggestions(query: string, container: HTMLElement, input: HTMLInputElement, signal: AbortSignal): Promise<void> {
     try {
-      // Use Scryfall's autocomplete API
-      const response = await fetch(`https://api.scryfall.com/cards/autocomplete?q=${encodeURIComponent(query)}`);
-      const data = await response.json();
-      
-      if (data.data && data.data.length > 0) {
-        this.displaySuggestions(data.data.slice(0, 8), container, input); // Limit to 8 suggestions
-      } else {
-        this.hideSuggestions(container);
-      }
+      // Use Scryfall's autocomplete API (cached per query in ScryfallAPI)
+      const suggestions = await ScryfallAPI.autocompleteCard(query, signal);
+      // Only the latest query's results are shown
+      if (signal.aborted) return;
+      this.showSuggestionResults(suggestions, container, input);
     } catch (error) {
+      if (signal.aborted) return;
       console.error('Error fetching card suggestions:', error);
       this.hideSuggestions(container);
     }
   }
 
+  private showSuggestionResults(suggestions: string[], container: HTMLElement, input: HTMLInputElement): void {
+    if (suggestions.length > 0) {
+      this.displaySuggestions(suggestions.slice(0, 8), container, input); // Limit to 8 suggestions
+    } else {
+      this.hideSuggestions(container);
+    }
+  }
+
   private displaySuggestions(suggestions: string[], container: HTMLElement, input: HTMLInputElement): void {
-    container.innerHTML = '';
     container.style.display = 'block';
+    // Same list as already shown (e.g. typing on within a cached answer):
+    // keep the existing items, and the keyboard selection with them
+    const key = suggestions.join('\n');
+    if (key === this.displayedSuggestions && container.childElementCount > 0) return;
+    this.displayedSuggestions = key;
     
+    // Build the list off-document and swap it in with one DOM update; clicks
+    // are handled by the single delegated listener on the container
+    const fragment = document.createDocumentFragment();
     suggestions.forEach((suggestion, index) => {
       const item = document.createElement('div');
       item.className = 'suggestion-item';
       item.textContent = suggestion;
       item.setAttribute('data-index', index.toString());
-      
-      item.addEventListener('click', () => {
-        this.selectSuggestion(suggestion, container, input);
-      });
-      
-      container.appendChild(item);
+      fragment.appendChild(item);
     });
+    container.replaceChildren(fragment);
   }
 
   private hideSuggestions(container: HTMLElement): void {
@@ -870,9 +1079,13 @@ export class CollectionTab extends BaseComponent {
       container.innerHTML = '';
       container.style.display = 'none';
     }
+    this.displayedSuggestions = '';
   }
 
   private selectSuggestion(suggestion: string, container: HTMLElement, input: HTMLInputElement): void {
+    // A pending lookup would reopen the list over the chosen name
+    this.suggestionController?.abort();
+    this.suggestionController = null;
     input.value = suggestion;
     this.hideSuggestions(container);
     
@@ -910,12 +1123,16 @@ export class CollectionTab extends BaseComponent {
   }
 
   private async populateCardDetails(cardName: string): Promise<void> {
+    const requestId = ++this.cardDetailsRequest;
     try {
       // Fetch full card details from Scryfall
-      const response = await fetch(`https://api.scryfall.com/cards/named?exact=${encodeURIComponent(cardName)}`);
-      const card = await response.json();
+      const card = await ScryfallAPI.getCardByName(cardName);
+      // Only the latest pick may fill the form; an earlier, slower lookup
+      // (or one for a modal that has since been closed) is dropped
+      const nameInput = document.getElementById('card-name-input') as HTMLInputElement | null;
+      if (requestId !== this.cardDetailsRequest || nameInput?.value !== cardName) return;
       
-      if (card && card.object !== 'error') {
+      if (card) {
         // Populate form fields with card data
         const typeInput = document.getElementById('card-type-input') as HTMLInputElement;
         const manaCostInput = document.getElementById('card-mana-cost-input') as HTMLInputElement;
@@ -1048,15 +1265,18 @@ export class CollectionTab extends BaseComponent {
     const statusElement = document.querySelector('#status-message');
     if (statusElement) {
       statusElement.textContent = message;
-      // Clear after 3 seconds
-      setTimeout(() => {
+      // Clear 3 seconds after the latest message, not after each one
+      clearTimeout(this.statusTimeout);
+      this.statusTimeout = window.setTimeout(() => {
         statusElement.textContent = 'Ready';
       }, 3000);
     }
   }
 
   // Enhanced loading method with better UX
-  async loadCollectionData(): Promise<void> {
+  // Pass the collection when the caller already read it from the store
+  // (null if nothing was saved); without it the store is read here
+  async loadCollectionData(preloaded?: Collection | null): Promise<void> {
     try {
       console.log('Loading collection data...');
       
@@ -1072,7 +1292,9 @@ export class CollectionTab extends BaseComponent {
       }
 
       // Load from storage
-      const savedCollection = await window.electronAPI?.store.get('collection');
+      const savedCollection = preloaded !== undefined
+        ? preloaded
+        : await window.electronAPI?.store.get('collection');
       
       if (savedCollection && savedCollection.cards) {
         console.log(`Loaded ${savedCollection.cards.length} cards from storage`);
@@ -1084,6 +1306,10 @@ export class CollectionTab extends BaseComponent {
         // Save the sample data
         await this.saveCollection();
       }
+
+      // Resolve CDN image URLs in the background; they persist in the card
+      // cache, so later sessions load thumbnails straight from the HTTP cache
+      this.resolveFallbackImages();
       
     } catch (error) {
       console.error('Error loading collection data:', error);
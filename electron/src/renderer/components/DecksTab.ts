@@ -1,17 +1,44 @@
 import { BaseComponent } from './BaseComponent';
 import { CardDetailsModal } from './CardDetailsModal';
+import { CardCache, CSVHandler, ScryfallAPI } from '../utils';
 import type { Deck, DeckCard, Card, Collection } from '../types';
 
+// Per-deck totals shown in the deck grid and editor header
+interface DeckSummary {
+  mainboardCount: number;
+  sideboardCount: number;
+  totalCards: number;
+  colors: string[];
+}
+
+// Characters that aren't safe in a download filename on any platform
+const UNSAFE_FILENAME_CHARS = /[^\w\-. ]+/g;
+const MAX_FILENAME_LENGTH = 180;
+
+// Short, stable 32-bit FNV-1a hash of a string (8 hex chars). Distinct
+// strings can share a hash, so it only makes equal ids unlikely, not impossible
+function hashName(value: string): string {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < value.length; i++) {
+    hash ^= value.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return (hash >>> 0).toString(16).padStart(8, '0');
+}
+
 export class DecksTab extends BaseComponent {
   private decks: Deck[] = [];
+  private decksProvided = false;
   private selectedDeck: Deck | null = null;
   private collection: Collection = { cards: [], lastModified: new Date().toISOString() };
-  private cardModal: CardDetailsModal;
   private onDeckSelectionChange: ((deck: Deck | null) => void) | null = null;
+  private deckSummaries: WeakMap<Deck, DeckSummary> = new WeakMap();
+  private saveTimeout: number = 0;
+  // Serialized exports per deck, dropped whenever the deck is touched
+  private deckExports: WeakMap<Deck, { csv?: string; text?: string }> = new WeakMap();
 
   constructor() {
     super('#decks-tab');
-    this.cardModal = new CardDetailsModal();
   }
 
   initialize(): void {
@@ -19,7 +46,11 @@ export class DecksTab extends BaseComponent {
     
     this.render();
     this.setupEventListeners();
-    this.loadDecks();
+    if (this.decksProvided) {
+      this.renderDeckList();
+    } else {
+      this.loadDecks();
+    }
     this.isInitialized = true;
   }
 
@@ -163,6 +194,9 @@ export class DecksTab extends BaseComponent {
     // Deck name and format inputs
     this.bindEvent('#deck-name', 'input', () => this.updateDeckName());
     this.bindEvent('#deck-format', 'change', () => this.updateDeckFormat());
+
+    // Don't lose a pending debounced save when the window closes
+    window.addEventListener('beforeunload', () => this.flushPendingSave());
   }
 
   // Public methods for global access
@@ -172,6 +206,7 @@ export class DecksTab extends BaseComponent {
 
   setDecks(decks: Deck[]): void {
     this.decks = decks;
+    this.decksProvided = true;
     this.renderDeckList();
   }
 
@@ -201,10 +236,7 @@ export class DecksTab extends BaseComponent {
       lastModified: new Date().toISOString()
     };
 
-    this.decks.push(newDeck);
-    this.renderDeckList();
-    this.selectDeck(newDeck);
-    this.saveDecks();
+    this.addDeck(newDeck);
   }
 
   copyDeck(): void {
@@ -214,14 +246,20 @@ export class DecksTab extends BaseComponent {
       ...this.selectedDeck,
       id: 'deck-' + Date.now(),
       name: this.selectedDeck.name + ' Copy',
-      mainboard: [...this.selectedDeck.mainboard],
-      sideboard: [...this.selectedDeck.sideboard],
+      // Clone the cards too, so edits to the copy don't leak into the original
+      mainboard: this.selectedDeck.mainboard.map(card => ({ ...card })),
+      sideboard: this.selectedDeck.sideboard.map(card => ({ ...card })),
       lastModified: new Date().toISOString()
     };
 
-    this.decks.push(copiedDeck);
-    this.renderDeckList();
-    this.selectDeck(copiedDeck);
+    this.addDeck(copiedDeck);
+  }
+
+  // Shared tail of every create/copy/import: register, show, select and persist
+  private addDeck(deck: Deck): void {
+    this.decks.push(deck);
+    this.appendDeckToList(deck);
+    this.selectDeck(deck);
     this.saveDecks();
   }
 
@@ -303,9 +341,9 @@ export class DecksTab extends BaseComponent {
       section[cardIndex].quantity = newQuantity;
     }
     
-    this.selectedDeck.lastModified = new Date().toISOString();
+    this.touchDeck(this.selectedDeck);
     this.renderDeckEditor();
-    this.saveDecks();
+    this.scheduleSave();
   }
 
   removeCard(cardName: string, isSideboard: boolean): void {
@@ -319,17 +357,26 @@ export class DecksTab extends BaseComponent {
     
     if (cardIndex > -1) {
       section.splice(cardIndex, 1);
-      this.selectedDeck.lastModified = new Date().toISOString();
+      this.touchDeck(this.selectedDeck);
       this.renderDeckEditor();
       this.saveDecks();
     }
   }
 
   showCardDetails(cardName: string): void {
-    this.cardModal.show(cardName);
+    const modal = CardDetailsModal.shared();
+    const deck = this.selectedDeck;
+    modal.show(cardName).then(shown => {
+      if (!shown || !deck || deck !== this.selectedDeck) return;
+      // Deck card data is already cached by prefetchDeckCards; this warms the
+      // full-size images of the next few cards down the list
+      const cards = [...deck.mainboard, ...deck.sideboard];
+      modal.prefetchAfter(cards, cards.findIndex(card => card.name === cardName));
+    });
   }
 
   clearDeckSelection(): void {
+    this.flushPendingSave();
     this.selectedDeck = null;
     
     // Show selection view, hide editor view
@@ -360,12 +407,17 @@ export class DecksTab extends BaseComponent {
     
     const a = document.createElement('a');
     a.href = url;
-    a.download = `${this.selectedDeck.name || 'deck'}.csv`;
+    a.download = `${this.sanitizeFilename(this.selectedDeck.name)}.csv`;
     a.click();
     
     URL.revokeObjectURL(url);
   }
 
+  private sanitizeFilename(name: string): string {
+    const safeName = (name || '').replace(UNSAFE_FILENAME_CHARS, '_').trim().slice(0, MAX_FILENAME_LENGTH);
+    return safeName || 'deck';
+  }
+
   copyToClipboard(): void {
     if (!this.selectedDeck) return;
     
@@ -406,6 +458,10 @@ export class DecksTab extends BaseComponent {
   }
 
   private async saveDecks(): Promise<void> {
+    // A direct save covers anything still waiting on the debounce
+    clearTimeout(this.saveTimeout);
+    this.saveTimeout = 0;
+
     try {
       await window.electronAPI?.store.set('decks', this.decks);
       console.log('Decks saved successfully');
@@ -414,6 +470,16 @@ export class DecksTab extends BaseComponent {
     }
   }
 
+  // Coalesce bursts of edits (typing a name, clicking +/-) into one store write
+  private scheduleSave(): void {
+    clearTimeout(this.saveTimeout);
+    this.saveTimeout = window.setTimeout(() => this.saveDecks(), 400);
+  }
+
+  private flushPendingSave(): void {
+    if (this.saveTimeout) this.saveDecks();
+  }
+
   private createSampleDeck(): Deck {
     return {
       id: 'sample-deck-' + Date.now(),
@@ -462,56 +528,61 @@ export class DecksTab extends BaseComponent {
         </div>
       `;
     } else {
-      deckGrid.innerHTML = this.decks.map(deck => {
-        const mainboardCount = deck.mainboard.reduce((sum, card) => sum + card.quantity, 0);
-        const sideboardCount = deck.sideboard.reduce((sum, card) => sum + card.quantity, 0);
-        const totalCards = mainboardCount + sideboardCount;
-        
-        // Get color identity from deck cards
-        const colors = new Set<string>();
-        [...deck.mainboard, ...deck.sideboard].forEach(card => {
-          if (card.colors) {
-            card.colors.forEach(c => colors.add(c));
-          }
-        });
-        const colorBadges = Array.from(colors).map(c => {
-          const colorClass = c === 'W' ? 'white' : 
-                            c === 'U' ? 'blue' : 
-                            c === 'B' ? 'black' :
-                            c === 'R' ? 'red' : 'green';
-          return `<span class="mana-symbol ${colorClass}">${c}</span>`;
-        }).join('');
-        
-        return `
-          <div class="deck-card" onclick="window.app?.components?.decks?.selectDeckById?.('${deck.id}');">
-            <div class="deck-card-header">
-              <h3 class="deck-card-name">${deck.name}</h3>
-              <span class="deck-card-format">${deck.format}</span>
-            </div>
-            <div class="deck-card-colors">
-              ${colorBadges || '<span class="text-muted">Colorless</span>'}
-            </div>
-            <div class="deck-card-stats">
-              <div class="deck-stat">
-                <span class="deck-stat-label">Total</span>
-                <span class="deck-stat-value">${totalCards}</span>
-              </div>
-              <div class="deck-stat">
-                <span class="deck-stat-label">Main</span>
-                <span class="deck-stat-value">${mainboardCount}</span>
-              </div>
-              <div class="deck-stat">
-                <span class="deck-stat-label">Side</span>
-                <span class="deck-stat-value">${sideboardCount}</span>
-              </div>
-            </div>
-            <div class="deck-card-footer">
-              <span class="deck-modified">Modified: ${deck.lastModified ? new Date(deck.lastModified).toLocaleDateString() : 'Never'}</span>
-            </div>
-          </div>
-        `;
-      }).join('');
+      deckGrid.innerHTML = this.decks.map(deck => this.renderDeckCard(deck)).join('');
+    }
+  }
+
+  // Add a single deck tile without rebuilding the whole grid
+  private appendDeckToList(deck: Deck): void {
+    const deckGrid = this.element.querySelector('#deck-grid');
+    if (!deckGrid || this.decks.length === 1) {
+      // First deck replaces the empty state, so a full render is needed
+      this.renderDeckList();
+      return;
     }
+
+    deckGrid.insertAdjacentHTML('beforeend', this.renderDeckCard(deck));
+  }
+
+  private renderDeckCard(deck: Deck): string {
+    const { mainboardCount, sideboardCount, totalCards, colors } = this.getDeckSummary(deck);
+    
+    const colorBadges = colors.map(c => {
+      const colorClass = c === 'W' ? 'white' : 
+                        c === 'U' ? 'blue' : 
+                        c === 'B' ? 'black' :
+                        c === 'R' ? 'red' : 'green';
+      return `<span class="mana-symbol ${colorClass}">${c}</span>`;
+    }).join('');
+    
+    return `
+      <div class="deck-card" onclick="window.app?.components?.decks?.selectDeckById?.('${deck.id}');">
+        <div class="deck-card-header">
+          <h3 class="deck-card-name">${deck.name}</h3>
+          <span class="deck-card-format">${deck.format}</span>
+        </div>
+        <div class="deck-card-colors">
+          ${colorBadges || '<span class="text-muted">Colorless</span>'}
+        </div>
+        <div class="deck-card-stats">
+          <div class="deck-stat">
+            <span class="deck-stat-label">Total</span>
+            <span class="deck-stat-value">${totalCards}</span>
+          </div>
+          <div class="deck-stat">
+            <span class="deck-stat-label">Main</span>
+            <span class="deck-stat-value">${mainboardCount}</span>
+          </div>
+          <div class="deck-stat">
+            <span class="deck-stat-label">Side</span>
+            <span class="deck-stat-value">${sideboardCount}</span>
+          </div>
+        </div>
+        <div class="deck-card-footer">
+          <span class="deck-modified">Modified: ${deck.lastModified ? new Date(deck.lastModified).toLocaleDateString() : 'Never'}</span>
+        </div>
+      </div>
+    `;
   }
 
   private selectDeck(deck: Deck): void {
@@ -526,6 +597,7 @@ export class DecksTab extends BaseComponent {
     
     this.renderDeckEditor();
     this.updateDeckInfo();
+    this.prefetchDeckCards(deck);
     
     // Notify listeners of deck selection change
     if (this.onDeckSelectionChange) {
@@ -533,6 +605,37 @@ export class DecksTab extends BaseComponent {
     }
   }
 
+  // Warm the card cache for the whole deck in a few batched requests,
+  // so opening card details from the editor doesn't hit the network. The
+  // same results fill in any placeholder cards left by earlier imports.
+  private prefetchDeckCards(deck: Deck): void {
+    const names = [...deck.mainboard, ...deck.sideboard].map(card => card.name);
+    if (names.length === 0) return;
+
+    ScryfallAPI.getCardsByNames(names).then(found => {
+      let upgraded = false;
+      for (const section of [deck.mainboard, deck.sideboard]) {
+        section.forEach((card, index) => {
+          if (card.typeLine !== 'Unknown') return;
+          const data = found.get(card.name.toLowerCase());
+          if (!data) return;
+          section[index] = { ...ScryfallAPI.transformScryfallCard(data), quantity: card.quantity };
+          upgraded = true;
+        });
+      }
+      if (!upgraded) return;
+
+      this.touchDeck(deck);
+      if (deck === this.selectedDeck) {
+        this.renderDeckEditor();
+        this.updateDeckInfo();
+      }
+      this.scheduleSave();
+    }).catch(error => {
+      console.error('Error prefetching deck cards:', error);
+    });
+  }
+
   private renderDeckEditor(): void {
     if (!this.selectedDeck) {
       this.clearDeckEditor();
@@ -636,31 +739,59 @@ export class DecksTab extends BaseComponent {
   private updateCardCounts(): void {
     if (!this.selectedDeck) {
       const elements = ['#deck-total-cards', '#deck-mainboard-cards', '#deck-sideboard-cards', '#mainboard-count', '#sideboard-count'];
-      elements.forEach(selector => {
-        const element = this.element.querySelector(selector);
-        if (element) element.textContent = '0';
-      });
+      elements.forEach(selector => this.setText(selector, '0'));
       return;
     }
 
-    const mainboardCount = this.selectedDeck.mainboard.reduce((sum, card) => sum + card.quantity, 0);
-    const sideboardCount = this.selectedDeck.sideboard.reduce((sum, card) => sum + card.quantity, 0);
-    const totalCount = mainboardCount + sideboardCount;
+    const { mainboardCount, sideboardCount, totalCards: totalCount } = this.getDeckSummary(this.selectedDeck);
+
+    this.setText('#deck-total-cards', totalCount.toString());
+    this.setText('#deck-mainboard-cards', mainboardCount.toString());
+    this.setText('#deck-sideboard-cards', sideboardCount.toString());
+    this.setText('#mainboard-count', mainboardCount.toString());
+    this.setText('#sideboard-count', sideboardCount.toString());
+  }
+
+  // Counts are refreshed on every quantity click; only touch the DOM
+  // (and invalidate layout) when the text actually changes
+  private setText(selector: string, text: string): void {
+    const element = this.element.querySelector(selector);
+    if (element && element.textContent !== text) element.textContent = text;
+  }
 
-    const totalElement = this.element.querySelector('#deck-total-cards');
-    if (totalElement) totalElement.textContent = totalCount.toString();
+  private getDeckSummary(deck: Deck): DeckSummary {
+    const cached = this.deckSummaries.get(deck);
+    if (cached) return cached;
 
-    const mainboardElement = this.element.querySelector('#deck-mainboard-cards');
-    if (mainboardElement) mainboardElement.textContent = mainboardCount.toString();
+    let mainboardCount = 0;
+    let sideboardCount = 0;
+    const colors = new Set<string>();
 
-    const sideboardElement = this.element.querySelector('#deck-sideboard-cards');
-    if (sideboardElement) sideboardElement.textContent = sideboardCount.toString();
+    // Get counts and color identity from deck cards in one pass per section
+    for (const card of deck.mainboard) {
+      mainboardCount += card.quantity;
+      card.colors?.forEach(c => colors.add(c));
+    }
+    for (const card of deck.sideboard) {
+      sideboardCount += card.quantity;
+      card.colors?.forEach(c => colors.add(c));
+    }
 
-    const mainboardCountSpan = this.element.querySelector('#mainboard-count');
-    if (mainboardCountSpan) mainboardCountSpan.textContent = mainboardCount.toString();
+    const summary: DeckSummary = {
+      mainboardCount,
+      sideboardCount,
+      totalCards: mainboardCount + sideboardCount,
+      colors: Array.from(colors)
+    };
+    this.deckSummaries.set(deck, summary);
+    return summary;
+  }
 
-    const sideboardCountSpan = this.element.querySelector('#sideboard-count');
-    if (sideboardCountSpan) sideboardCountSpan.textContent = sideboardCount.toString();
+  // Mark a deck as modified; must be called after any change to its cards
+  private touchDeck(deck: Deck): void {
+    deck.lastModified = new Date().toISOString();
+    this.deckSummaries.delete(deck);
+    this.deckExports.delete(deck);
   }
 
   private switchSection(section: string): void {
@@ -680,9 +811,9 @@ export class DecksTab extends BaseComponent {
     const nameInput = this.element.querySelector('#deck-name') as HTMLInputElement;
     if (nameInput) {
       this.selectedDeck.name = nameInput.value;
-      this.selectedDeck.lastModified = new Date().toISOString();
-      this.renderDeckList();
-      this.saveDecks();
+      this.touchDeck(this.selectedDeck);
+      // The deck grid is hidden while editing and is re-rendered on the way back
+      this.scheduleSave();
     }
   }
 
@@ -691,26 +822,29 @@ export class DecksTab extends BaseComponent {
     const formatSelect = this.element.querySelector('#deck-format') as HTMLSelectElement;
     if (formatSelect) {
       this.selectedDeck.format = formatSelect.value;
-      this.selectedDeck.lastModified = new Date().toISOString();
+      this.touchDeck(this.selectedDeck);
       this.renderDeckList();
       this.saveDecks();
     }
   }
 
   private async addCardToDeck(cardName: string, quantity: number, isSideboard: boolean): Promise<void> {
-    if (!this.selectedDeck) return;
+    // Pin the deck up front: the user may switch decks while we wait on Scryfall
+    const deck = this.selectedDeck;
+    if (!deck) return;
     
-    const section = isSideboard ? this.selectedDeck.sideboard : this.selectedDeck.mainboard;
+    const section = isSideboard ? deck.sideboard : deck.mainboard;
     const existingCard = section.find(card => card.name === cardName);
     
     if (existingCard) {
       existingCard.quantity += quantity;
     } else {
       // Fetch real card data from Scryfall
+      let newCard: DeckCard;
       try {
         const cardData = await this.fetchCardData(cardName);
         if (cardData) {
-          const newCard: DeckCard = {
+          newCard = {
             id: cardData.id,
             name: cardData.name,
             quantity: quantity,
@@ -724,49 +858,52 @@ export class DecksTab extends BaseComponent {
             imageUri: cardData.imageUri,
             scryfallId: cardData.scryfallId
           };
-          section.push(newCard);
         } else {
           // Fallback if card not found
-          const newCard: DeckCard = {
-            id: `${cardName.toLowerCase().replace(/[^a-z0-9]/g, '-')}-${Date.now()}`,
-            name: cardName,
-            quantity: quantity,
-            typeLine: 'Unknown',
-            manaCost: '',
-            colors: []
-          };
-          section.push(newCard);
+          newCard = this.createPlaceholderCard(cardName, quantity);
         }
       } catch (error) {
         console.error('Error fetching card data:', error);
         // Fallback card
-        const newCard: DeckCard = {
-          id: `${cardName.toLowerCase().replace(/[^a-z0-9]/g, '-')}-${Date.now()}`,
-          name: cardName,
-          quantity: quantity,
-          typeLine: 'Unknown',
-          manaCost: '',
-          colors: []
-        };
+        newCard = this.createPlaceholderCard(cardName, quantity);
+      }
+
+      // Another add of the same card may have landed while we were waiting
+      const added = section.find(card => card.name === newCard.name);
+      if (added) {
+        added.quantity += quantity;
+      } else {
         section.push(newCard);
       }
     }
     
-    this.selectedDeck.lastModified = new Date().toISOString();
-    this.renderDeckEditor();
+    this.touchDeck(deck);
+    if (deck === this.selectedDeck) {
+      this.renderDeckEditor();
+    }
     this.saveDecks();
   }
 
+  // Minimal deck entry for a card we have no Scryfall data for (yet)
+  private createPlaceholderCard(name: string, quantity: number): DeckCard {
+    return {
+      // Slugs alone collide ("Fire // Ice" vs "Fire-Ice"), so suffix a hash of the
+      // exact name. Deck entries are matched by name, never by this id.
+      id: `${name.toLowerCase().replace(/[^a-z0-9]/g, '-')}-${hashName(name)}`,
+      name: name,
+      quantity: quantity,
+      typeLine: 'Unknown',
+      manaCost: '',
+      colors: []
+    };
+  }
+
   private async fetchCardData(cardName: string): Promise<Card | null> {
     try {
-      const encodedName = encodeURIComponent(cardName);
-      const response = await fetch(`https://api.scryfall.com/cards/named?exact=${encodedName}`);
-      
-      if (!response.ok) {
-        throw new Error(`HTTP error! status: ${response.status}`);
-      }
-      
-      const data = await response.json();
+      // Go through the shared client so lookups hit the card cache and
+      // reuse the same rate-limited connection to Scryfall
+      const data = await ScryfallAPI.getCardByName(cardName);
+      if (!data) return null;
       
       return {
         id: data.id,
@@ -783,11 +920,11 @@ export class DecksTab extends BaseComponent {
         setCode: data.set || '',
         setName: data.set_name || '',
         collectorNumber: data.collector_number || '',
-        imageUri: data.image_uris?.normal || data.image_uris?.large || '',
+        imageUri: data.image_uris?.normal || data.image_uris?.large || data.card_faces?.[0]?.image_uris?.normal || '',
         scryfallId: data.id,
         scryfallUri: data.scryfall_uri || '',
         legalities: data.legalities || {},
-        prices: data.prices || {}
+        prices: data.prices || CardCache.getPriceData(cardName) || {}
       };
     } catch (error) {
       console.error('Error fetching from Scryfall:', error);
@@ -796,6 +933,7 @@ export class DecksTab extends BaseComponent {
   }
 
   private showImportDialog(fromClipboard: boolean = false): void {
+    ScryfallAPI.preconnect();
     const dialog = document.createElement('div');
     dialog.className = 'import-dialog';
     
@@ -830,80 +968,118 @@ export class DecksTab extends BaseComponent {
     }
   }
 
-  processImport(): void {
+  async processImport(): Promise<void> {
     const dialog = document.querySelector('.import-dialog');
     const textarea = dialog?.querySelector('#import-text') as HTMLTextAreaElement;
     
     if (!textarea || !textarea.value.trim()) return;
     
-    const lines = textarea.value.trim().split('\n');
-    const importedCards: DeckCard[] = [];
+    const entries = CSVHandler.parseDeckList(textarea.value);
     
-    for (const line of lines) {
-      const match = line.trim().match(/^(\d+)\s+(.+)$/);
-      if (match) {
-        const quantity = parseInt(match[1]);
-        const name = match[2].trim();
-        
-        importedCards.push({
-          id: `${name.toLowerCase().replace(/[^a-z0-9]/g, '-')}-${Date.now()}`,
-          name: name,
-          quantity: quantity,
-          typeLine: 'Unknown',
-          manaCost: '',
-          colors: []
-        });
+    if (entries.length === 0) {
+      dialog?.remove();
+      return;
+    }
+
+    const importButton = dialog?.querySelector('.import-footer .btn-primary') as HTMLButtonElement | null;
+    if (importButton) {
+      importButton.disabled = true;
+      importButton.textContent = 'Importing...';
+    }
+
+    // Owned cards that were resolved from Scryfall already carry its data;
+    // manual and sample entries don't, so those are looked up like the rest
+    const owned = new Map<string, Card>();
+    for (const card of this.collection.cards) {
+      if (card.scryfallId) owned.set(card.name.toLowerCase(), card);
+    }
+    const unknownNames = entries.map(entry => entry.name).filter(name => !owned.has(name.toLowerCase()));
+
+    // Resolve every name up front in a few /cards/collection requests
+    // instead of leaving placeholders to be looked up one at a time later
+    let found = new Map<string, any>();
+    if (unknownNames.length > 0) {
+      try {
+        found = await ScryfallAPI.resolveCardNames(unknownNames);
+      } catch (error) {
+        console.error('Error resolving imported cards:', error);
       }
     }
-    
-    if (importedCards.length > 0) {
-      // Create new deck with imported cards
-      const newDeck: Deck = {
-        id: 'imported-deck-' + Date.now(),
-        name: 'Imported Deck',
-        format: 'Standard',
-        mainboard: importedCards,
-        sideboard: [],
-        lastModified: new Date().toISOString()
-      };
-      
-      this.decks.push(newDeck);
-      this.renderDeckList();
-      this.selectDeck(newDeck);
-      this.saveDecks();
+
+    // The dialog was closed (Cancel / ×) while names were resolving: the
+    // user has abandoned this import, so don't add the deck behind their back
+    if (dialog && !dialog.isConnected) return;
+
+    const importedCards: DeckCard[] = [];
+    const sideboardCards: DeckCard[] = [];
+    for (const entry of entries) {
+      const key = entry.name.toLowerCase();
+      const ownedCard = owned.get(key);
+      const data = found.get(key);
+      const card = ownedCard
+        ? { ...ownedCard, quantity: entry.quantity }
+        : data
+        ? { ...ScryfallAPI.transformScryfallCard(data), quantity: entry.quantity }
+        : this.createPlaceholderCard(entry.name, entry.quantity);
+      (entry.sideboard ? sideboardCards : importedCards).push(card);
     }
     
+    // Create new deck with imported cards
+    const newDeck: Deck = {
+      id: 'imported-deck-' + Date.now(),
+      name: 'Imported Deck',
+      format: 'Standard',
+      mainboard: importedCards,
+      sideboard: sideboardCards,
+      lastModified: new Date().toISOString()
+    };
+    
+    this.addDeck(newDeck);
     dialog?.remove();
   }
 
   private generateDeckCSV(deck: Deck): string {
-    let csv = 'Quantity,Name,Type,Section\n';
-    
-    deck.mainboard.forEach(card => {
-      csv += `${card.quantity},"${card.name}","${card.typeLine || 'Unknown'}",Mainboard\n`;
-    });
-    
-    deck.sideboard.forEach(card => {
-      csv += `${card.quantity},"${card.name}","${card.typeLine || 'Unknown'}",Sideboard\n`;
-    });
-    
-    return csv;
+    const cached = this.getDeckExports(deck);
+    if (cached.csv !== undefined) return cached.csv;
+
+    const lines = ['Quantity,Name,Type,Section'];
+    for (const card of deck.mainboard) {
+      lines.push(`${card.quantity},"${card.name}","${card.typeLine || 'Unknown'}",Mainboard`);
+    }
+    for (const card of deck.sideboard) {
+      lines.push(`${card.quantity},"${card.name}","${card.typeLine || 'Unknown'}",Sideboard`);
+    }
+
+    cached.csv = lines.join('\n') + '\n';
+    return cached.csv;
   }
 
   private generateDeckText(deck: Deck): string {
-    let text = `${deck.name}\n\nMainboard:\n`;
-    
-    deck.mainboard.forEach(card => {
-      text += `${card.quantity} ${card.name}\n`;
-    });
-    
+    const cached = this.getDeckExports(deck);
+    if (cached.text !== undefined) return cached.text;
+
+    const lines = [deck.name, '', 'Mainboard:'];
+    for (const card of deck.mainboard) {
+      lines.push(`${card.quantity} ${card.name}`);
+    }
+
     if (deck.sideboard.length > 0) {
-      text += `\nSideboard:\n`;
-      deck.sideboard.forEach(card => {
-        text += `${card.quantity} ${card.name}\n`;
-      });
+      lines.push('', 'Sideboard:');
+      for (const card of deck.sideboard) {
+        lines.push(`${card.quantity} ${card.name}`);
+      }
     }
-    
-    return text;
+
+    cached.text = lines.join('\n') + '\n';
+    return cached.text;
+  }
+
+  private getDeckExports(deck: Deck): { csv?: string; text?: string } {
+    let exports = this.deckExports.get(deck);
+    if (!exports) {
+      exports = {};
+      this.deckExports.set(deck, exports);
+    }
+    return exports;
   }
 }
@@ -3,6 +3,7 @@
  * Ported from Python recommendation systems for Electron/TypeScript
  */
 
+import { ScryfallAPI } from '../utils';
 import type { Card, Deck, DeckCard } from '../types';
 
 export interface SmartRecommendation {
@@ -42,11 +43,44 @@ export interface DeckAnalysis {
   };
 }
 
+interface SearchOptions {
+  format?: string;
+  page?: number;
+  unique?: string;
+  order?: string;
+}
+
+// A deck theme prepared for matching against candidate cards
+interface ThemeTerm {
+  theme: string;
+  lower: string;
+  words: string[];
+}
+
+// Theme names like "tribal_elf" or "card draw" split into words
+const THEME_WORD_SEPARATOR = /[_\s]+/;
+
+// Char codes for W, U, B, R, G
+const COLORED_MANA = new Set([87, 85, 66, 82, 71]);
+
+// Evergreen keywords looked for in a candidate card's oracle text
+const CANDIDATE_KEYWORDS = [
+  'flying', 'first strike', 'double strike', 'deathtouch', 'haste',
+  'hexproof', 'indestructible', 'lifelink', 'menace', 'reach',
+  'trample', 'vigilance', 'flash', 'prowess', 'ward'
+];
+
+// Keywords tallied when analysing the deck itself
+const DECK_KEYWORDS = ['haste', 'flying', 'trample', 'deathtouch', 'lifelink', 'vigilance',
+                       'first strike', 'double strike', 'flash', 'prowess', 'hexproof', 'ward'];
+
 export class RecommendationEngine {
   private cache: Map<string, any> = new Map();
   private cacheExpiry: Map<string, number> = new Map();
   private readonly CACHE_DURATION = 5 * 60 * 1000; // 5 minutes
-  private readonly REQUEST_DELAY = 100; // 100ms between requests to avoid rate limiting
+  private readonly MAX_CACHE_ENTRIES = 200; // Least recently used entries are dropped past this
+  private readonly MAX_PARALLEL_SEARCHES = 4;
+  private themeTermsCache: WeakMap<string[], ThemeTerm[]> = new WeakMap();
 
   private archetypePatterns: { [key: string]: any } = {
     aggro: {
@@ -126,51 +160,70 @@ export class RecommendationEngine {
     return !expiry || Date.now() > expiry;
   }
 
+  // Returns the cached value for key, or undefined when missing or expired.
+  // Hits move to the back of the Map so eviction drops the least recently used.
+  private getCached(key: string): any {
+    if (!this.cache.has(key)) return undefined;
+
+    const value = this.cache.get(key);
+    this.cache.delete(key);
+    if (this.isExpired(key)) {
+      this.cacheExpiry.delete(key);
+      return undefined;
+    }
+
+    this.cache.set(key, value);
+    return value;
+  }
+
   private setCache(key: string, data: any): void {
+    this.cache.delete(key);
     this.cache.set(key, data);
     this.cacheExpiry.set(key, Date.now() + this.CACHE_DURATION);
+
+    while (this.cache.size > this.MAX_CACHE_ENTRIES) {
+      const oldest = this.cache.keys().next().value;
+      if (oldest === undefined) break;
+      this.cache.delete(oldest);
+      this.cacheExpiry.delete(oldest);
+    }
   }
 
-  private async delay(ms: number): Promise<void> {
-    return new Promise(resolve => setTimeout(resolve, ms));
+  // Run searches in windows of MAX_PARALLEL_SEARCHES, so one query's latency
+  // overlaps the next. Results are handed to onResult in query order; once it
+  // returns false (e.g. the phase has enough cards) no further window is sent.
+  private async searchMany(
+    queries: string[],
+    options: SearchOptions,
+    onResult: (cards: any[], index: number) => boolean
+  ): Promise<void> {
+    for (let start = 0; start < queries.length; start += this.MAX_PARALLEL_SEARCHES) {
+      const batch = queries.slice(start, start + this.MAX_PARALLEL_SEARCHES);
+      const results = await Promise.all(batch.map(query => this.searchCards(query, options)));
+      for (let i = 0; i < results.length; i++) {
+        if (!onResult(results[i], start + i)) return;
+      }
+    }
   }
 
   /**
    * Scryfall API integration methods
    */
-  private async searchCards(query: string, options: {
-    format?: string;
-    page?: number;
-    unique?: string;
-    order?: string;
-  } = {}): Promise<any[]> {
+  private async searchCards(query: string, options: SearchOptions = {}): Promise<any[]> {
     const cacheKey = this.getCacheKey('search', { query, ...options });
     
-    if (this.cache.has(cacheKey) && !this.isExpired(cacheKey)) {
-      return this.cache.get(cacheKey);
+    const cached = this.getCached(cacheKey);
+    if (cached !== undefined) {
+      return cached;
     }
 
-    await this.delay(this.REQUEST_DELAY);
-
     try {
-      const params = new URLSearchParams({
-        q: query,
-        unique: options.unique || 'cards',
-        order: options.order || 'name',
-        page: (options.page || 1).toString()
-      });
-
-      if (options.format) {
-        params.append('q', `${query} legal:${options.format}`);
-      }
-
-      const response = await fetch(`https://api.scryfall.com/cards/search?${params}`);
-      const data = await response.json();
-
-      if (data.object === 'error') {
-        console.warn('Scryfall search error:', data.details);
-        return [];
-      }
+      // Same client path as the rest of the app: shared rate limit, 429 retries
+      const data = await ScryfallAPI.searchCards(
+        options.format ? `${query} legal:${options.format}` : query,
+        options.page || 1,
+        { unique: options.unique || 'cards', order: options.order || 'name' }
+      );
 
       const cards = data.data || [];
       this.setCache(cacheKey, cards);
@@ -182,24 +235,9 @@ export class RecommendationEngine {
   }
 
   private async getCardByName(cardName: string): Promise<any | null> {
-    const cacheKey = this.getCacheKey('named', { name: cardName });
-    
-    if (this.cache.has(cacheKey) && !this.isExpired(cacheKey)) {
-      return this.cache.get(cacheKey);
-    }
-
-    await this.delay(this.REQUEST_DELAY);
-
     try {
-      const response = await fetch(`https://api.scryfall.com/cards/named?exact=${encodeURIComponent(cardName)}`);
-      const data = await response.json();
-
-      if (data.object === 'error') {
-        return null;
-      }
-
-      this.setCache(cacheKey, data);
-      return data;
+      // ScryfallAPI keeps its own card cache and joins duplicate lookups
+      return await ScryfallAPI.getCardByName(cardName);
     } catch (error) {
       console.error('Error fetching card by name:', error);
       return null;
@@ -261,6 +299,7 @@ export class RecommendationEngine {
     const oracleText = scryfallCard.oracle_text?.toLowerCase() || '';
     const cardName = scryfallCard.name?.toLowerCase() || '';
     const typeLine = scryfallCard.type_line?.toLowerCase() || '';
+    const themeTerms = this.getThemeTerms(deckAnalysis);
     
     // Keyword synergies with deck (more detailed scoring)
     let keywordSynergyScore = 0;
@@ -280,14 +319,11 @@ export class RecommendationEngine {
     
     // Theme synergies with enhanced pattern matching
     let themeSynergyScore = 0;
-    deckAnalysis.themes.forEach(theme => {
-      const themeWords = theme.toLowerCase().split(/[_\s]+/);
-      themeWords.forEach(word => {
-        if (word.length > 2) {
-          if (cardName.includes(word)) themeSynergyScore += 20; // Name match is strongest
-          else if (oracleText.includes(word)) themeSynergyScore += 15;
-          else if (typeLine.includes(word)) themeSynergyScore += 10;
-        }
+    themeTerms.forEach(({ words }) => {
+      words.forEach(word => {
+        if (cardName.includes(word)) themeSynergyScore += 20; // Name match is strongest
+        else if (oracleText.includes(word)) themeSynergyScore += 15;
+        else if (typeLine.includes(word)) themeSynergyScore += 10;
       });
     });
     score += Math.min(themeSynergyScore, 35); // Cap theme synergy
@@ -296,9 +332,10 @@ export class RecommendationEngine {
     if (typeLine.includes('creature')) {
       const creatureTypes = this.extractCreatureTypes(typeLine);
       creatureTypes.forEach((type: string) => {
-        if (deckAnalysis.themes.some(theme => 
-          theme.toLowerCase().includes(type.toLowerCase()) ||
-          theme.toLowerCase().includes(type.toLowerCase() + 's') // plural
+        const lowerType = type.toLowerCase();
+        if (themeTerms.some(({ lower }) => 
+          lower.includes(lowerType) ||
+          lower.includes(lowerType + 's') // plural
         )) {
           score += 25; // Strong tribal synergy
         }
@@ -447,8 +484,8 @@ export class RecommendationEngine {
     
     // Theme synergy
     const cardName = scryfallCard.name?.toLowerCase() || '';
-    deckAnalysis.themes.forEach(theme => {
-      if (cardName.includes(theme.toLowerCase()) || oracleText.includes(theme.toLowerCase())) {
+    this.getThemeTerms(deckAnalysis).forEach(({ lower }) => {
+      if (cardName.includes(lower) || oracleText.includes(lower)) {
         score += 15;
       }
     });
@@ -476,6 +513,7 @@ export class RecommendationEngine {
     const cardName = scryfallCard.name?.toLowerCase() || '';
     const typeLine = scryfallCard.type_line?.toLowerCase() || '';
     const cmc = scryfallCard.cmc || 0;
+    const themeTerms = this.getThemeTerms(deckAnalysis);
     
     // Color compatibility reasons
     const cardColors = scryfallCard.colors || [];
@@ -533,10 +571,9 @@ export class RecommendationEngine {
     
     // Theme synergies with more specific matching
     let themeMatches = 0;
-    deckAnalysis.themes.forEach(theme => {
-      const themeWords = theme.toLowerCase().split(/[_\s]+/);
-      themeWords.forEach(word => {
-        if (word.length > 2 && (cardName.includes(word) || oracleText.includes(word) || typeLine.includes(word))) {
+    themeTerms.forEach(({ theme, words }) => {
+      words.forEach(word => {
+        if (cardName.includes(word) || oracleText.includes(word) || typeLine.includes(word)) {
           reasons.push(`Synergizes with ${theme.replace('_', ' ')} theme`);
           themeMatches++;
         }
@@ -554,9 +591,8 @@ export class RecommendationEngine {
     const creatureTypes = this.extractCreatureTypes(typeLine);
     if (creatureTypes.length > 0) {
       creatureTypes.forEach(type => {
-        const typeInDeck = deckAnalysis.themes.some(theme => 
-          theme.toLowerCase().includes(type.toLowerCase())
-        );
+        const lowerType = type.toLowerCase();
+        const typeInDeck = themeTerms.some(({ lower }) => lower.includes(lowerType));
         if (typeInDeck) {
           reasons.push(`${type} tribal synergy`);
         }
@@ -584,17 +620,25 @@ export class RecommendationEngine {
     return reasons.slice(0, 4); // Limit to 4 most relevant reasons
   }
 
+  // Lower-cased themes and their match words (longer than 2 characters),
+  // worked out once per analysis instead of for every scored card
+  private getThemeTerms(deckAnalysis: DeckAnalysis): ThemeTerm[] {
+    let terms = this.themeTermsCache.get(deckAnalysis.themes);
+    if (!terms) {
+      terms = deckAnalysis.themes.map(theme => {
+        const lower = theme.toLowerCase();
+        return { theme, lower, words: lower.split(THEME_WORD_SEPARATOR).filter(word => word.length > 2) };
+      });
+      this.themeTermsCache.set(deckAnalysis.themes, terms);
+    }
+    return terms;
+  }
+
   private extractKeywordsFromText(oracleText: string): string[] {
     const keywords: string[] = [];
     const text = oracleText.toLowerCase();
     
-    const keywordList = [
-      'flying', 'first strike', 'double strike', 'deathtouch', 'haste',
-      'hexproof', 'indestructible', 'lifelink', 'menace', 'reach',
-      'trample', 'vigilance', 'flash', 'prowess', 'ward'
-    ];
-    
-    keywordList.forEach(keyword => {
+    CANDIDATE_KEYWORDS.forEach(keyword => {
       if (text.includes(keyword)) {
         keywords.push(keyword);
       }
@@ -811,7 +855,8 @@ export class RecommendationEngine {
     collection: any = null,
     count: number = 100,
     formatName: string = 'standard',
-    progressCallback: (progress: { phase: string, count: number, total: number, recommendations: any[] }) => void
+    progressCallback: (progress: { phase: string, count: number, total: number, recommendations: any[] }) => void,
+    signal?: AbortSignal
   ): Promise<SmartRecommendation[]> {
     if (!deck || !deck.mainboard) {
       return [];
@@ -838,6 +883,8 @@ export class RecommendationEngine {
       recommendations: [] 
     });
 
+    // Stop between phases once the caller has moved on
+    signal?.throwIfAborted();
     const stapleRecs = await this.getFormatStaplesRecommendations(
       formatName, deckAnalysis.colors, currentCards, stapleCount, deckAnalysis
     );
@@ -851,6 +898,7 @@ export class RecommendationEngine {
     });
 
     // Phase 2: Archetype cards
+    signal?.throwIfAborted();
     const archetypeRecs = await this.getArchetypeRecommendations(
       deckAnalysis.archetype, deckAnalysis.colors, currentCards, formatName, archetypeCount, deckAnalysis
     );
@@ -864,6 +912,7 @@ export class RecommendationEngine {
     });
 
     // Phase 3: Synergy cards
+    signal?.throwIfAborted();
     const synergyRecs = await this.getSynergyRecommendations(
       deck, deckAnalysis, currentCards, formatName, synergyCount
     );
@@ -877,6 +926,7 @@ export class RecommendationEngine {
     });
 
     // Phase 4: Curve fillers
+    signal?.throwIfAborted();
     const curveRecs = await this.getCurveRecommendations(
       deckAnalysis.curve, deckAnalysis.colors, currentCards, formatName, curveCount, deckAnalysis
     );
@@ -889,6 +939,8 @@ export class RecommendationEngine {
       recommendations: [...recommendations] 
     });
 
+    signal?.throwIfAborted();
+
     console.log(`🔍 Found ${recommendations.length} total recommendations before deduplication`);
 
     // Remove duplicates and sort by confidence
@@ -937,17 +989,27 @@ export class RecommendationEngine {
   private parseCMC(manaCost: string): number {
     if (!manaCost) return 0;
     
-    let cmc = 0;
-    const genericMatch = manaCost.match(/(\d+)/);
-    if (genericMatch) {
-      cmc += parseInt(genericMatch[1]);
+    // Single scan: the first run of digits is the generic cost, and every
+    // W/U/B/R/G adds one - no regex match arrays allocated per card
+    let generic = 0;
+    let colored = 0;
+    let genericState = 0; // 0 = not seen yet, 1 = reading digits, 2 = done
+    
+    for (let i = 0; i < manaCost.length; i++) {
+      const code = manaCost.charCodeAt(i);
+      if (code >= 48 && code <= 57) {
+        if (genericState === 2) continue;
+        generic = generic * 10 + (code - 48);
+        genericState = 1;
+        continue;
+      }
+      if (genericState === 1) genericState = 2;
+      
+      // Count colored mana symbols
+      if (COLORED_MANA.has(code)) colored++;
     }
     
-    // Count colored mana symbols
-    const coloredSymbols = manaCost.match(/[WUBRG]/g) || [];
-    cmc += coloredSymbols.length;
-    
-    return cmc;
+    return generic + colored;
   }
 
   private extractTypes(typeLine: string): string[] {
@@ -959,10 +1021,7 @@ export class RecommendationEngine {
     const keywords: string[] = [];
     const text = oracleText.toLowerCase();
     
-    const keywordList = ['haste', 'flying', 'trample', 'deathtouch', 'lifelink', 'vigilance', 
-                         'first strike', 'double strike', 'flash', 'prowess', 'hexproof', 'ward'];
-    
-    keywordList.forEach(keyword => {
+    DECK_KEYWORDS.forEach(keyword => {
       if (text.includes(keyword)) {
         keywords.push(keyword);
       }
@@ -1030,7 +1089,7 @@ export class RecommendationEngine {
     
     const creatureRatio = (types['creature'] || 0) / totalCards;
     const spellRatio = ((types['instant'] || 0) + (types['sorcery'] || 0)) / totalCards;
-    const avgCMC = Object.entries(curve).reduce((sum, [cmc, count]) => sum + (parseInt(cmc) * count), 0) / totalCards;
+    const avgCMC = this.averageCmc(curve, totalCards);
     
     // Low curve percentage (CMC 0-2)
     const lowCurveRatio = ((curve[0] || 0) + (curve[1] || 0) + (curve[2] || 0)) / totalCards;
@@ -1155,8 +1214,16 @@ export class RecommendationEngine {
     return Math.round((creatureScore + spellScore) / 2);
   }
 
+  private averageCmc(curve: { [cmc: number]: number }, totalCards: number): number {
+    let total = 0;
+    for (const cmc in curve) {
+      total += Number(cmc) * curve[cmc];
+    }
+    return total / totalCards;
+  }
+
   private calculateManaEfficiency(curve: { [cmc: number]: number }, totalCards: number): number {
-    const avgCMC = Object.entries(curve).reduce((sum, [cmc, count]) => sum + (parseInt(cmc) * count), 0) / totalCards;
+    const avgCMC = this.averageCmc(curve, totalCards);
     
     // Ideal average CMC is around 2.5-3.5
     if (avgCMC >= 2.5 && avgCMC <= 3.5) return 100;
@@ -1235,19 +1302,16 @@ export class RecommendationEngine {
       
       console.log(`🎯 Searching for ${limit} ${archetype} cards across ${archetypePatterns.searchQueries.length} queries`);
       
-      for (const searchQuery of archetypePatterns.searchQueries) {
-        if (recommendations.length >= limit) break;
-        
-        const fullQuery = colorQuery ? `${colorQuery} ${searchQuery}` : searchQuery;
-        
-        console.log(`🔍 ${archetype} query: ${fullQuery}`);
-        
-        const archetypeCards = await this.searchCards(fullQuery, {
-          format: formatName,
-          order: 'cmc',
-          unique: 'cards'
-        });
-
+      const queries = archetypePatterns.searchQueries.map(searchQuery =>
+        colorQuery ? `${colorQuery} ${searchQuery}` : searchQuery
+      );
+      console.log(`🔍 ${archetype} queries: ${queries.join(' | ')}`);
+      
+      await this.searchMany(queries, {
+        format: formatName,
+        order: 'cmc',
+        unique: 'cards'
+      }, archetypeCards => {
         console.log(`📦 Query returned ${archetypeCards.length} ${archetype} cards`);
 
         for (const card of archetypeCards.slice(0, cardsPerQuery * 2)) { // Get extra to filter
@@ -1264,7 +1328,8 @@ export class RecommendationEngine {
           
           recommendations.push(recommendation);
         }
-      }
+        return recommendations.length < limit;
+      });
       
       console.log(`✅ Found ${recommendations.length} archetype recommendations`);
     } catch (error) {
@@ -1293,9 +1358,8 @@ export class RecommendationEngine {
       
       console.log(`🧩 Searching for ${limit} synergy cards across themes: ${themes.join(', ')}`);
       
+      const themeQueries: Array<{ theme: string; query: string }> = [];
       for (const theme of themes) {
-        if (recommendations.length >= limit) break;
-        
         let themeQuery = '';
         
         switch (theme) {
@@ -1326,12 +1390,15 @@ export class RecommendationEngine {
         
         const fullQuery = colorQuery ? `${colorQuery} ${themeQuery}` : themeQuery;
         console.log(`🔍 ${theme} synergy: ${fullQuery}`);
-        
-        const synergyCards = await this.searchCards(fullQuery, {
-          format: formatName,
-          order: 'name',
-          unique: 'cards'
-        });
+        themeQueries.push({ theme, query: fullQuery });
+      }
+      
+      await this.searchMany(themeQueries.map(entry => entry.query), {
+        format: formatName,
+        order: 'name',
+        unique: 'cards'
+      }, (synergyCards, i) => {
+        const theme = themeQueries[i].theme;
 
         console.log(`📦 ${theme} returned ${synergyCards.length} synergy cards`);
 
@@ -1349,7 +1416,8 @@ export class RecommendationEngine {
           
           recommendations.push(recommendation);
         }
-      }
+        return recommendations.length < limit;
+      });
       
       console.log(`✅ Found ${recommendations.length} synergy recommendations`);
     } catch (error) {
@@ -1390,19 +1458,17 @@ export class RecommendationEngine {
       const cardsPerGap = Math.ceil(limit / curveGaps.length);
       console.log(`📊 Found curve gaps at CMC: ${curveGaps.join(', ')}, getting ${cardsPerGap} cards each`);
       
-      for (const gapCmc of curveGaps) {
-        if (recommendations.length >= limit) break;
-        
-        const cmcQuery = `cmc:${gapCmc}`;
-        const fullQuery = colorQuery ? `${colorQuery} ${cmcQuery}` : cmcQuery;
-        
-        console.log(`🔍 Curve filler at CMC ${gapCmc}: ${fullQuery}`);
-        
-        const curveCards = await this.searchCards(fullQuery, {
-          format: formatName,
-          order: 'name',
-          unique: 'cards'
-        });
+      const gapQueries = curveGaps.map(gapCmc =>
+        colorQuery ? `${colorQuery} cmc:${gapCmc}` : `cmc:${gapCmc}`
+      );
+      console.log(`🔍 Curve filler queries: ${gapQueries.join(' | ')}`);
+      
+      await this.searchMany(gapQueries, {
+        format: formatName,
+        order: 'name',
+        unique: 'cards'
+      }, (curveCards, i) => {
+        const gapCmc = curveGaps[i];
 
         console.log(`📦 CMC ${gapCmc} returned ${curveCards.length} curve cards`);
 
@@ -1419,7 +1485,8 @@ export class RecommendationEngine {
           
           recommendations.push(recommendation);
         }
-      }
+        return recommendations.length < limit;
+      });
       
       console.log(`✅ Found ${recommendations.length} curve recommendations`);
     } catch (error) {
@@ -5,6 +5,7 @@ const electronAPI = {
   // File operations
   openFileDialog: (options: any) => ipcRenderer.invoke('dialog:openFile', options),
   saveFileDialog: (options: any) => ipcRenderer.invoke('dialog:saveFile', options),
+  readTextFile: (filePath: string) => ipcRenderer.invoke('file:readText', filePath),
 
   // Store operations (persistent data storage)
   store: {
@@ -11,10 +11,30 @@ interface CachedData<T> {
 class CardCache {
   private static readonly CARD_CACHE_KEY = 'decksmith_card_cache';
   private static readonly PRICE_CACHE_KEY = 'decksmith_price_cache';
+  private static readonly MISSING_CACHE_KEY = 'decksmith_missing_cards';
   
   // Cache expiration times (in milliseconds)
   private static readonly CARD_EXPIRY = 180 * 24 * 60 * 60 * 1000; // 6 months - card data rarely changes
   private static readonly PRICE_EXPIRY = 1 * 24 * 60 * 60 * 1000;  // 1 day - prices update more frequently
+  private static readonly MISSING_EXPIRY = 1 * 24 * 60 * 60 * 1000; // 1 day - new sets can make a name resolvable
+
+  // Entry cap per cache; least recently used entries are dropped first
+  private static readonly MAX_ENTRIES = 5000;
+  // Card fields read back from the cache (see compact())
+  private static readonly CACHED_FIELDS = [
+    'id', 'name', 'mana_cost', 'cmc', 'type_line', 'oracle_text', 'colors', 'color_identity',
+    'power', 'toughness', 'rarity', 'set', 'set_name', 'collector_number', 'legalities', 'scryfall_uri'
+  ];
+  private static readonly CACHED_FACE_FIELDS = ['name', 'mana_cost', 'type_line', 'oracle_text', 'power', 'toughness'];
+
+  // Parsed caches, keyed by storage key. The card cache can grow to
+  // thousands of entries, so it is parsed once and reused instead of
+  // re-parsing the whole localStorage blob on every lookup.
+  private static memory = new Map<string, Record<string, CachedData<any>>>();
+
+  // Storage keys with in-memory changes not yet written to localStorage
+  private static dirty = new Set<string>();
+  private static flushScheduled = false;
   
   static getCardData(cardName: string): any | null {
     const cache = this.loadCache(this.CARD_CACHE_KEY);
@@ -24,6 +44,7 @@ class CardCache {
       const entry = cache[key] as CachedData<any>;
       if (!this.isExpired(entry.timestamp, this.CARD_EXPIRY)) {
         console.log(`Cache hit for card: ${cardName}`);
+        this.markUsed(cache, key);
         return entry.data;
       } else {
         // Remove expired entry
@@ -39,8 +60,9 @@ class CardCache {
     const cache = this.loadCache(this.CARD_CACHE_KEY);
     const key = cardName.toLowerCase().trim();
     
+    delete cache[key];
     cache[key] = {
-      data: cardData,
+      data: this.compact(cardData),
       timestamp: Date.now(),
       cachedAt: new Date().toISOString()
     };
@@ -49,6 +71,34 @@ class CardCache {
     console.log(`Cached card data for: ${cardName}`);
   }
   
+  // Cache card and price data for many cards with a single write per cache
+  static cacheCardBatch(entries: Array<{ name: string; data: any; prices?: any }>): void {
+    if (entries.length === 0) return;
+
+    const cardCache = this.loadCache(this.CARD_CACHE_KEY);
+    const priceCache = this.loadCache(this.PRICE_CACHE_KEY);
+    const timestamp = Date.now();
+    const cachedAt = new Date(timestamp).toISOString();
+    let pricesChanged = false;
+
+    for (const entry of entries) {
+      const key = entry.name.toLowerCase().trim();
+      delete cardCache[key];
+      cardCache[key] = { data: this.compact(entry.data), timestamp, cachedAt };
+      if (entry.prices) {
+        delete priceCache[key];
+        priceCache[key] = { data: entry.prices, timestamp, cachedAt };
+        pricesChanged = true;
+      }
+    }
+
+    this.saveCache(this.CARD_CACHE_KEY, cardCache);
+    if (pricesChanged) {
+      this.saveCache(this.PRICE_CACHE_KEY, priceCache);
+    }
+    console.log(`Cached card data for ${entries.length} cards`);
+  }
+  
   static getPriceData(cardName: string): any | null {
     const cache = this.loadCache(this.PRICE_CACHE_KEY);
     const key = cardName.toLowerCase().trim();
@@ -56,6 +106,7 @@ class CardCache {
     if (cache[key]) {
       const entry = cache[key] as CachedData<any>;
       if (!this.isExpired(entry.timestamp, this.PRICE_EXPIRY)) {
+        this.markUsed(cache, key);
         return entry.data;
       } else {
         delete cache[key];
@@ -70,6 +121,7 @@ class CardCache {
     const cache = this.loadCache(this.PRICE_CACHE_KEY);
     const key = cardName.toLowerCase().trim();
     
+    delete cache[key];
     cache[key] = {
       data: priceData,
       timestamp: Date.now(),
@@ -79,6 +131,28 @@ class CardCache {
     this.saveCache(this.PRICE_CACHE_KEY, cache);
   }
   
+  // Names Scryfall couldn't resolve even fuzzily. Remembered for a day so
+  // re-importing the same list doesn't ask about them again.
+  static isKnownMissing(cardName: string): boolean {
+    const cache = this.loadCache(this.MISSING_CACHE_KEY);
+    const entry = cache[cardName.toLowerCase().trim()];
+    return !!entry && !this.isExpired(entry.timestamp, this.MISSING_EXPIRY);
+  }
+
+  static markMissing(cardNames: string[]): void {
+    if (cardNames.length === 0) return;
+
+    const cache = this.loadCache(this.MISSING_CACHE_KEY);
+    const timestamp = Date.now();
+    const cachedAt = new Date(timestamp).toISOString();
+    for (const name of cardNames) {
+      const key = name.toLowerCase().trim();
+      delete cache[key];
+      cache[key] = { data: true, timestamp, cachedAt };
+    }
+    this.saveCache(this.MISSING_CACHE_KEY, cache);
+  }
+
   static invalidateCache(cardName?: string): void {
     if (cardName) {
       const key = cardName.toLowerCase().trim();
@@ -94,12 +168,17 @@ class CardCache {
     } else {
       localStorage.removeItem(this.CARD_CACHE_KEY);
       localStorage.removeItem(this.PRICE_CACHE_KEY);
+      localStorage.removeItem(this.MISSING_CACHE_KEY);
+      this.memory.delete(this.CARD_CACHE_KEY);
+      this.memory.delete(this.PRICE_CACHE_KEY);
+      this.memory.delete(this.MISSING_CACHE_KEY);
       console.log('Invalidated all card caches');
     }
   }
   
   static invalidatePriceCache(): void {
     localStorage.removeItem(this.PRICE_CACHE_KEY);
+    this.memory.delete(this.PRICE_CACHE_KEY);
     console.log('Invalidated price cache');
   }
   
@@ -115,22 +194,91 @@ class CardCache {
     };
   }
   
+  // Keep only the parts of a Scryfall card the app reads back. A full card
+  // object is mostly purchase links, related URIs and image variants we never
+  // load, so this roughly halves what each entry costs in memory and storage.
+  private static compact(data: any): any {
+    const compacted: Record<string, any> = {};
+    for (const field of this.CACHED_FIELDS) {
+      if (data[field] !== undefined) compacted[field] = data[field];
+    }
+    if (data.image_uris) compacted.image_uris = this.compactImages(data.image_uris);
+    if (data.card_faces) {
+      compacted.card_faces = data.card_faces.map((face: any) => {
+        const compactedFace: Record<string, any> = {};
+        for (const field of this.CACHED_FACE_FIELDS) {
+          if (face[field] !== undefined) compactedFace[field] = face[field];
+        }
+        if (face.image_uris) compactedFace.image_uris = this.compactImages(face.image_uris);
+        return compactedFace;
+      });
+    }
+    return compacted;
+  }
+
+  private static compactImages(imageUris: any): any {
+    return { small: imageUris.small, normal: imageUris.normal, large: imageUris.large };
+  }
+
   private static loadCache(key: string): Record<string, CachedData<any>> {
+    const parsed = this.memory.get(key);
+    if (parsed) return parsed;
+
+    let cache: Record<string, CachedData<any>> = {};
     try {
       const cached = localStorage.getItem(key);
-      return cached ? JSON.parse(cached) : {};
+      if (cached) cache = JSON.parse(cached);
     } catch (error) {
       console.error(`Error loading cache ${key}:`, error);
-      return {};
+    }
+
+    this.memory.set(key, cache);
+    return cache;
+  }
+  
+  // Object keys keep insertion order, so re-inserting a key makes it the
+  // most recently used and the first key is always the eviction candidate
+  private static markUsed(cache: Record<string, CachedData<any>>, key: string): void {
+    const entry = cache[key];
+    delete cache[key];
+    cache[key] = entry;
+  }
+
+  private static evictOverflow(cache: Record<string, CachedData<any>>): void {
+    const keys = Object.keys(cache);
+    const overflow = keys.length - this.MAX_ENTRIES;
+    for (let i = 0; i < overflow; i++) {
+      delete cache[keys[i]];
     }
   }
   
   private static saveCache(key: string, cache: Record<string, CachedData<any>>): void {
-    try {
-      localStorage.setItem(key, JSON.stringify(cache));
-    } catch (error) {
-      console.error(`Error saving cache ${key}:`, error);
+    this.evictOverflow(cache);
+    this.memory.set(key, cache);
+
+    // Reads are served from memory, so persisting can wait. Serialising a
+    // cache of thousands of cards on every lookup blocked the UI thread;
+    // queue the key and write everything from this burst in one idle flush.
+    this.dirty.add(key);
+    if (!this.flushScheduled) {
+      this.flushScheduled = true;
+      requestIdleCallback(() => this.flush(), { timeout: 2000 });
+    }
+  }
+
+  // Write queued cache changes to localStorage now
+  static flush(): void {
+    this.flushScheduled = false;
+    for (const key of this.dirty) {
+      const cache = this.memory.get(key);
+      if (!cache) continue; // Invalidated since it was queued
+      try {
+        localStorage.setItem(key, JSON.stringify(cache));
+      } catch (error) {
+        console.error(`Error saving cache ${key}:`, error);
+      }
     }
+    this.dirty.clear();
   }
   
   private static isExpired(timestamp: number, expiryMs: number): boolean {
@@ -140,20 +288,112 @@ class CardCache {
 
 class ScryfallAPI {
   private static readonly BASE_URL = 'https://api.scryfall.com';
+  private static readonly IMAGE_ORIGIN = 'https://cards.scryfall.io';
   private static readonly REQUEST_DELAY = 100; // 100ms between requests
+  private static readonly COLLECTION_BATCH_SIZE = 75; // Scryfall's per-request identifier limit
+  private static readonly MAX_BATCHES_IN_FLIGHT = 3;
+  private static readonly MAX_FUZZY_IN_FLIGHT = 4;
+  private static readonly MAX_RETRIES = 3; // retries after a 429 response
+  private static readonly RETRY_BASE_DELAY = 1000;
+  private static readonly AUTOCOMPLETE_MAX_RESULTS = 20; // Scryfall's cap per autocomplete response
+  private static readonly AUTOCOMPLETE_CACHE_LIMIT = 256;
+  private static readonly NON_WORD_CHARS = /[^a-z0-9\s]+/g;
+  private static readonly WHITESPACE_RUNS = /\s+/g;
   private static lastRequestTime = 0;
+  private static preconnectLinks: HTMLLinkElement[] = [];
+  // Autocomplete answers by normalized query; least recently used dropped first
+  private static autocompleteCache = new Map<string, string[]>();
 
-  static async searchCards(query: string, page = 1): Promise<any> {
+  // Lookups currently on the wire, so duplicate names (a deck's 24 Plains, a
+  // hover prefetch followed by a click) share one request
+  private static inflight = new Map<string, { promise: Promise<any>; controller: AbortController; waiters: number }>();
+
+  // Every Scryfall call goes through here so they share one set of request
+  // defaults (and Chromium's pooled connection to the API origin)
+  private static async request(url: string, init: RequestInit = {}): Promise<Response> {
+    const options = {
+      ...init,
+      headers: { Accept: 'application/json', ...(init.headers as Record<string, string> | undefined) }
+    };
+
+    for (let attempt = 0; ; attempt++) {
+      const response = await fetch(url, options);
+      if (response.status !== 429 || attempt >= this.MAX_RETRIES) return response;
+
+      // Too many requests: hold every caller's next slot back for as long as
+      // Scryfall asks (or back off exponentially), then retry through the
+      // limiter so retries queue up REQUEST_DELAY apart behind the others
+      const retryAfter = Number(response.headers.get('Retry-After'));
+      const wait = retryAfter > 0 ? retryAfter * 1000 : this.RETRY_BASE_DELAY * 2 ** attempt;
+      this.lastRequestTime = Math.max(this.lastRequestTime, Date.now() + wait - this.REQUEST_DELAY);
+      console.warn(`Scryfall rate limit hit, retrying in ${wait}ms or later`);
+      await this.rateLimit();
+      init.signal?.throwIfAborted();
+    }
+  }
+
+  // The page-load preconnect hints go idle and get closed after a few
+  // seconds; re-issue them when an import is about to start so the first
+  // lookup and image don't pay for DNS + TLS
+  static preconnect(): void {
+    // The hint fires on insertion, so swap in fresh elements each time
+    this.preconnectLinks.forEach(link => link.remove());
+    this.preconnectLinks = [this.BASE_URL, this.IMAGE_ORIGIN].map(href => {
+      const link = document.createElement('link');
+      link.rel = 'preconnect';
+      link.href = href;
+      if (href === this.BASE_URL) link.crossOrigin = 'anonymous';
+      document.head.appendChild(link);
+      return link;
+    });
+  }
+
+  // Join the in-flight request for key, or start one with fetcher. The shared
+  // request is only aborted once every caller that passed a signal has given up.
+  private static coalesce<T>(key: string, fetcher: (signal: AbortSignal) => Promise<T>, signal?: AbortSignal): Promise<T> {
+    signal?.throwIfAborted();
+
+    let entry = this.inflight.get(key);
+    if (!entry || entry.controller.signal.aborted) {
+      const controller = new AbortController();
+      const created = { promise: Promise.resolve() as Promise<any>, controller, waiters: 0 };
+      created.promise = fetcher(controller.signal).finally(() => {
+        if (this.inflight.get(key) === created) this.inflight.delete(key);
+      });
+      this.inflight.set(key, created);
+      entry = created;
+    }
+
+    const shared = entry;
+    shared.waiters++;
+    if (!signal) return shared.promise;
+
+    return new Promise<T>((resolve, reject) => {
+      const onAbort = () => {
+        if (--shared.waiters === 0) shared.controller.abort();
+        reject(signal.reason);
+      };
+      signal.addEventListener('abort', onAbort, { once: true });
+      shared.promise.then(resolve, reject).finally(() => signal.removeEventListener('abort', onAbort));
+    });
+  }
+
+  static async searchCards(query: string, page = 1, options: { unique?: string; order?: string } = {}): Promise<any> {
     await this.rateLimit();
     
     const url = new URL(`${this.BASE_URL}/cards/search`);
     url.searchParams.set('q', query);
     url.searchParams.set('page', page.toString());
+    if (options.unique) url.searchParams.set('unique', options.unique);
+    if (options.order) url.searchParams.set('order', options.order);
     
     try {
-      const response = await fetch(url.toString());
+      const response = await this.request(url.toString());
       
       if (!response.ok) {
+        if (response.status === 404) {
+          return { object: 'list', data: [] }; // No cards match
+        }
         throw new Error(`HTTP error! status: ${response.status}`);
       }
       
@@ -164,7 +404,7 @@ class ScryfallAPI {
     }
   }
 
-  static async getCardByName(name: string, forceRefresh = false): Promise<any> {
+  static async getCardByName(name: string, forceRefresh = false, signal?: AbortSignal): Promise<any> {
     // Check cache first unless force refresh is requested
     if (!forceRefresh) {
       const cached = CardCache.getCardData(name);
@@ -173,13 +413,18 @@ class ScryfallAPI {
       }
     }
     
+    return this.coalesce(`exact:${name.toLowerCase()}`, shared => this.fetchCardByName(name, shared), signal);
+  }
+
+  private static async fetchCardByName(name: string, signal: AbortSignal): Promise<any> {
     await this.rateLimit();
+    signal.throwIfAborted();
     
     const url = new URL(`${this.BASE_URL}/cards/named`);
     url.searchParams.set('exact', name);
     
     try {
-      const response = await fetch(url.toString());
+      const response = await this.request(url.toString(), { signal });
       
       if (!response.ok) {
         if (response.status === 404) {
@@ -218,13 +463,17 @@ class ScryfallAPI {
       }
     }
     
+    return this.coalesce(`fuzzy:${cacheKey}`, () => this.fetchCardByFuzzyName(name, cacheKey));
+  }
+
+  private static async fetchCardByFuzzyName(name: string, cacheKey: string): Promise<any> {
     await this.rateLimit();
     
     const url = new URL(`${this.BASE_URL}/cards/named`);
     url.searchParams.set('fuzzy', name);
     
     try {
-      const response = await fetch(url.toString());
+      const response = await this.request(url.toString());
       
       if (!response.ok) {
         if (response.status === 404) {
@@ -258,38 +507,223 @@ class ScryfallAPI {
     }
   }
 
-  static async autocompleteCard(query: string): Promise<string[]> {
+  // Look up many cards by exact name using the /cards/collection endpoint
+  // (up to 75 identifiers per request). Cached cards are served locally and
+  // everything fetched is written back to the cache. Names Scryfall already
+  // rejected (CardCache.isKnownMissing) aren't asked about again unless
+  // forceRefresh is set. Returns a map keyed by the lower-cased requested
+  // name; names Scryfall couldn't find are absent.
+  static async getCardsByNames(
+    names: string[],
+    forceRefresh = false,
+    onProgress?: (done: number, total: number) => void
+  ): Promise<Map<string, any>> {
+    const results = new Map<string, any>();
+    const missing: string[] = [];
+    const seen = new Set<string>();
+
+    for (const name of names) {
+      const key = name.trim().toLowerCase();
+      if (!key || seen.has(key)) continue;
+      seen.add(key);
+
+      if (!forceRefresh) {
+        const cached = CardCache.getCardData(key);
+        if (cached) {
+          const prices = CardCache.getPriceData(key);
+          results.set(key, prices ? { ...cached, prices } : cached);
+          continue;
+        }
+        if (CardCache.isKnownMissing(key)) continue;
+      }
+      missing.push(name.trim());
+    }
+
+    const batches: string[][] = [];
+    for (let i = 0; i < missing.length; i += this.COLLECTION_BATCH_SIZE) {
+      batches.push(missing.slice(i, i + this.COLLECTION_BATCH_SIZE));
+    }
+
+    // Keep a few batches in flight so one request's latency overlaps the
+    // next; rateLimit() still spaces out when each request starts
+    let nextBatch = 0;
+    let resolved = 0;
+    const worker = async (): Promise<void> => {
+      while (nextBatch < batches.length) {
+        const batch = batches[nextBatch++];
+        await this.fetchCollectionBatch(batch, results);
+        resolved += batch.length;
+        onProgress?.(resolved, missing.length);
+      }
+    };
+
+    const workerCount = Math.min(this.MAX_BATCHES_IN_FLIGHT, batches.length);
+    await Promise.all(Array.from({ length: workerCount }, worker));
+
+    return results;
+  }
+
+  // getCardsByNames, plus a fuzzy lookup for the (usually few) names the
+  // collection endpoint couldn't match exactly, e.g. typos or missing
+  // punctuation in pasted lists. Keyed by the lower-cased requested name.
+  static async resolveCardNames(names: string[]): Promise<Map<string, any>> {
+    const results = await this.getCardsByNames(names);
+
+    const unmatched = new Map<string, string>();
+    for (const name of names) {
+      const key = name.trim().toLowerCase();
+      if (key && !results.has(key) && !CardCache.isKnownMissing(key)) unmatched.set(key, name.trim());
+    }
+
+    // A few lookups share the wait for responses; rateLimit() still spaces
+    // out when each one starts
+    const missing: string[] = [];
+    const pending = [...unmatched];
+    const worker = async (): Promise<void> => {
+      while (pending.length > 0) {
+        const [key, name] = pending.shift()!;
+        try {
+          const card = await this.getCardByFuzzyName(name);
+          if (card) {
+            results.set(key, card);
+          } else {
+            missing.push(key);
+          }
+        } catch (error) {
+          console.error(`Fuzzy lookup failed for "${name}":`, error);
+        }
+      }
+    };
+    const workerCount = Math.min(this.MAX_FUZZY_IN_FLIGHT, pending.length);
+    await Promise.all(Array.from({ length: workerCount }, worker));
+    CardCache.markMissing(missing);
+
+    return results;
+  }
+
+  private static async fetchCollectionBatch(batch: string[], results: Map<string, any>): Promise<void> {
+    await this.rateLimit();
+
+    try {
+      const response = await this.request(`${this.BASE_URL}/cards/collection`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ identifiers: batch.map(name => ({ name })) })
+      });
+
+      if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+      }
+
+      const data = await response.json();
+
+      // Results aren't positionally aligned with the request when some
+      // names are missing, so match by full name and by face name
+      const byName = new Map<string, any>();
+      for (const card of data.data || []) {
+        const fullName = (card.name || '').toLowerCase();
+        byName.set(fullName, card);
+        fullName.split(' // ').forEach((face: string) => {
+          if (!byName.has(face)) byName.set(face, card);
+        });
+      }
+
+      const toCache: Array<{ name: string; data: any; prices?: any }> = [];
+      for (const name of batch) {
+        const key = name.toLowerCase();
+        const card = byName.get(key);
+        if (!card) continue;
+
+        // Cache the card data (excluding prices) and prices separately
+        const cardDataWithoutPrices = { ...card };
+        delete cardDataWithoutPrices.prices;
+        toCache.push({ name: key, data: cardDataWithoutPrices, prices: card.prices });
+
+        results.set(key, card);
+      }
+      CardCache.cacheCardBatch(toCache);
+    } catch (error) {
+      console.error('Scryfall collection lookup error:', error);
+    }
+  }
+
+  // Suggestions for query answered from earlier responses, if possible: an
+  // exact hit, or a shorter prefix's answer narrowed down locally. A prefix
+  // answer only counts when it came back under Scryfall's result cap, since
+  // then it held every match and the longer query's matches are among them.
+  static getCachedAutocomplete(query: string): string[] | undefined {
+    const key = this.normalizeQuery(query);
+    const exact = this.autocompleteCache.get(key);
+    if (exact) {
+      this.autocompleteCache.delete(key);
+      this.autocompleteCache.set(key, exact);
+      return exact;
+    }
+
+    for (let length = key.length - 1; length >= 2; length--) {
+      const parent = this.autocompleteCache.get(key.slice(0, length));
+      if (parent && parent.length < this.AUTOCOMPLETE_MAX_RESULTS) {
+        const narrowed = parent.filter(name => this.normalizeQuery(name).includes(key));
+        // Scryfall's matching is looser than ours, so let it decide "no matches"
+        return narrowed.length > 0 ? narrowed : undefined;
+      }
+    }
+    return undefined;
+  }
+
+  // Scryfall matches autocomplete case- and punctuation-insensitively, and
+  // ignores punctuation rather than splitting on it ("gaeas" finds "Gaea's")
+  private static normalizeQuery(text: string): string {
+    return text.toLowerCase().replace(this.NON_WORD_CHARS, '').replace(this.WHITESPACE_RUNS, ' ').trim();
+  }
+
+  static async autocompleteCard(query: string, signal?: AbortSignal): Promise<string[]> {
+    const cached = this.getCachedAutocomplete(query);
+    if (cached) return cached;
+
     await this.rateLimit();
+    signal?.throwIfAborted();
     
     const url = new URL(`${this.BASE_URL}/cards/autocomplete`);
     url.searchParams.set('q', query);
     
     try {
-      const response = await fetch(url.toString());
+      const response = await this.request(url.toString(), { signal });
       
       if (!response.ok) {
         throw new Error(`HTTP error! status: ${response.status}`);
       }
       
       const data = await response.json();
-      return data.data || [];
+      const names: string[] = data.data || [];
+      const key = this.normalizeQuery(query);
+      this.autocompleteCache.delete(key);
+      this.autocompleteCache.set(key, names);
+      if (this.autocompleteCache.size > this.AUTOCOMPLETE_CACHE_LIMIT) {
+        const oldest = this.autocompleteCache.keys().next().value;
+        if (oldest !== undefined) this.autocompleteCache.delete(oldest);
+      }
+      return names;
     } catch (error) {
+      if (signal?.aborted) throw error;
       console.error('Scryfall autocomplete error:', error);
       return [];
     }
   }
 
-  private static async rateLimit(): Promise<void> {
+  // Shared by every Scryfall caller in the renderer (including the
+  // recommendation engine), so together they stay under the rate limit.
+  // Cache hits return before reaching it and never wait.
+  static async rateLimit(): Promise<void> {
+    // Reserve the next free slot before waiting, so concurrent callers
+    // queue up REQUEST_DELAY apart instead of all waking at once
     const now = Date.now();
-    const timeSinceLastRequest = now - this.lastRequestTime;
+    const slot = Math.max(now, this.lastRequestTime + this.REQUEST_DELAY);
+    this.lastRequestTime = slot;
     
-    if (timeSinceLastRequest < this.REQUEST_DELAY) {
-      await new Promise(resolve => 
-        setTimeout(resolve, this.REQUEST_DELAY - timeSinceLastRequest)
-      );
+    if (slot > now) {
+      await new Promise(resolve => setTimeout(resolve, slot - now));
     }
-    
-    this.lastRequestTime = Date.now();
   }
 
   static transformScryfallCard(scryfallCard: any): Card {
@@ -308,7 +742,10 @@ class ScryfallAPI {
       setCode: scryfallCard.set || '',
       setName: scryfallCard.set_name || '',
       collectorNumber: scryfallCard.collector_number || '',
-      imageUri: scryfallCard.image_uris?.normal || scryfallCard.image_uris?.large,
+      // Double-faced cards only have images per face; use the front so the
+      // grid can load it from the CDN instead of the rate-limited API redirect
+      imageUri: scryfallCard.image_uris?.normal || scryfallCard.image_uris?.large ||
+        scryfallCard.card_faces?.[0]?.image_uris?.normal,
       scryfallId: scryfallCard.id,
       quantity: 1
     };
@@ -317,60 +754,154 @@ class ScryfallAPI {
 
 // CSV handling utilities
 class CSVHandler {
+  private static readonly QUOTE_PATTERN = /"/g;
+  // Arena format: "4 Lightning Bolt (M21) 159" - the optional set/collector suffix
+  private static readonly ARENA_SET_SUFFIX = /\s*\([^)]+\)\s*\d*$/;
+  // Section headers that Arena and most deck sites put between card lines
+  private static readonly SECTION_HEADERS = new Set(['deck', 'mainboard', 'commander', 'companion', 'sideboard']);
+  private static readonly HEADER_SUFFIX = /\s*:$/;
+
   static parseCollectionCSV(csvText: string): Array<{name: string, quantity: number}> {
-    const lines = csvText.split('\n').map(line => line.trim()).filter(line => line);
     const cards: Array<{name: string, quantity: number}> = [];
-    
-    // Skip header if it exists
-    const startIndex = lines[0]?.toLowerCase().includes('card') || lines[0]?.toLowerCase().includes('name') ? 1 : 0;
-    
-    for (let i = startIndex; i < lines.length; i++) {
-      const line = lines[i];
-      if (!line) continue;
+    let isFirstLine = true;
+    // Column positions, resolved once from the header (name first, quantity
+    // second when there is no header)
+    let nameIndex = 0;
+    let quantityIndex = 1;
+    
+    // Walk the text once, line by line, without building a lines array
+    this.forEachLine(csvText, line => {
+      // Skip header if it exists
+      if (isFirstLine) {
+        isFirstLine = false;
+        const lower = line.toLowerCase();
+        if (lower.includes('card') || lower.includes('name')) {
+          const headers = lower.split(',').map(h => h.trim().replace(this.QUOTE_PATTERN, ''));
+          // Prefer an exact card-name column so e.g. "Set Name" can't win
+          let foundName = headers.findIndex(h => h === 'name' || h === 'card name' || h === 'card');
+          if (foundName === -1) foundName = headers.findIndex(h => h.includes('name'));
+          const foundQuantity = headers.findIndex(h => h === 'quantity' || h === 'count' || h === 'qty');
+          if (foundName !== -1) nameIndex = foundName;
+          if (foundQuantity !== -1) quantityIndex = foundQuantity;
+          return;
+        }
+      }
       
-      // Handle different CSV formats
-      const parts = line.split(',').map(part => part.trim().replace(/"/g, ''));
+      // Only two columns are used, so slice them out directly instead of
+      // splitting the whole row
+      const name = this.csvField(line, nameIndex)?.trim().replace(this.QUOTE_PATTERN, '');
+      if (!name) return;
       
-      if (parts.length >= 2) {
-        const name = parts[0];
-        const quantity = parseInt(parts[1]) || 1;
-        
-        if (name && quantity > 0) {
+      const quantityField = this.csvField(line, quantityIndex);
+      if (quantityField !== undefined) {
+        const quantity = parseInt(quantityField.trim().replace(this.QUOTE_PATTERN, '')) || 1;
+        if (quantity > 0) {
           cards.push({ name, quantity });
         }
-      } else if (parts.length === 1) {
-        // Single column - assume card name with quantity 1
-        const name = parts[0];
-        if (name) {
-          cards.push({ name, quantity: 1 });
-        }
+      } else {
+        // Missing column - assume card name with quantity 1
+        cards.push({ name, quantity: 1 });
       }
-    }
+    });
     
     return cards;
   }
 
+  // The index-th comma-separated field of line, or undefined if the row is
+  // shorter than that. Commas inside double quotes ("Jace, the Mind
+  // Sculptor") don't split fields.
+  private static csvField(line: string, index: number): string | undefined {
+    let field = 0;
+    let start = 0;
+    let quoted = false;
+    for (let i = 0; i < line.length; i++) {
+      const code = line.charCodeAt(i);
+      if (code === 34) { // "
+        quoted = !quoted;
+      } else if (code === 44 && !quoted) { // ,
+        if (field === index) return line.slice(start, i);
+        field++;
+        start = i + 1;
+      }
+    }
+    return field === index ? line.slice(start) : undefined;
+  }
+
   static parseArenaFormat(arenaText: string): Array<{name: string, quantity: number}> {
-    const lines = arenaText.split('\n').map(line => line.trim()).filter(line => line);
-    const cards: Array<{name: string, quantity: number}> = [];
-    
-    for (const line of lines) {
-      if (!line || line.startsWith('//')) continue; // Skip comments
-      
-      // Arena format: "4 Lightning Bolt (M21) 159"
-      const match = line.match(/^(\d+)\s+([^(]+?)(?:\s+\([^)]+\)\s*\d*)?$/);
-      
-      if (match) {
-        const quantity = parseInt(match[1]) || 1;
-        const name = match[2].trim();
-        
-        if (name && quantity > 0) {
-          cards.push({ name, quantity });
+    return this.parseDeckList(arenaText, false, true).map(({ name, quantity }) => ({ name, quantity }));
+  }
+
+  // The one parser behind every pasted list (deck import, clipboard import,
+  // parseArenaFormat): Arena exports and "4 Lightning Bolt"-style text. Lines
+  // after a "Sideboard" header are flagged, and repeated lines for the same
+  // card within a section are merged (across sections too when mergeSections
+  // is set, for callers with no sideboard). Count-less lines are taken as a
+  // single copy only when allowBareNames is set.
+  static parseDeckList(text: string, allowBareNames = false, mergeSections = false): Array<{name: string, quantity: number, sideboard: boolean}> {
+    const entries: Array<{name: string, quantity: number, sideboard: boolean}> = [];
+    const entryByKey = new Map<string, {name: string, quantity: number, sideboard: boolean}>();
+    let inSideboard = false;
+    let lineNumber = 0;
+    // A bare first line followed by a section header is the deck's name
+    // (as generateDeckText writes it), not a card
+    let titleKey: string | null = null;
+    
+    this.forEachLine(text, line => {
+      if (line.startsWith('//')) return; // Skip comments
+      lineNumber++;
+
+      // "Sideboard" and "Sideboard:" are both headers
+      const header = line.toLowerCase().replace(this.HEADER_SUFFIX, '');
+      if (this.SECTION_HEADERS.has(header)) {
+        if (lineNumber === 2 && titleKey !== null) {
+          entryByKey.delete(titleKey);
+          entries.pop();
         }
+        inSideboard = header === 'sideboard';
+        return;
       }
-    }
+      
+      // Read the leading count digit by digit, so the number is parsed in
+      // the same scan that finds where it ends
+      let index = 0;
+      let quantity = 0;
+      for (; index < line.length; index++) {
+        const code = line.charCodeAt(index);
+        if (code < 48 || code > 57) break;
+        quantity = quantity * 10 + (code - 48);
+      }
+      // A count needs whitespace after it; otherwise it's a bare name (or noise)
+      const counted = index > 0 && line.charCodeAt(index) <= 32;
+      if (!counted && !allowBareNames) return;
+
+      const name = (counted ? line.slice(index) : line).replace(this.ARENA_SET_SUFFIX, '').trim();
+      if (!name) return;
+
+      const key = mergeSections ? name.toLowerCase() : `${inSideboard ? 'sb' : 'mb'}:${name.toLowerCase()}`;
+      const existing = entryByKey.get(key);
+      if (existing) {
+        existing.quantity += quantity || 1;
+      } else {
+        const entry = { name, quantity: quantity || 1, sideboard: inSideboard };
+        entryByKey.set(key, entry);
+        entries.push(entry);
+        if (lineNumber === 1 && !counted) titleKey = key;
+      }
+    });
     
-    return cards;
+    return entries;
+  }
+
+  // Calls fn with each trimmed, non-empty line of text
+  private static forEachLine(text: string, fn: (line: string) => void): void {
+    let start = 0;
+    while (start <= text.length) {
+      let end = text.indexOf('\n', start);
+      if (end === -1) end = text.length;
+      const line = text.slice(start, end).trim();
+      if (line) fn(line);
+      start = end + 1;
+    }
   }
 
   static exportCollectionToCSV(cards: Card[]): string {
@@ -423,5 +954,8 @@ class CSVHandler {
   }
 }
 
+// Don't lose cache writes still waiting for an idle slot
+window.addEventListener('beforeunload', () => CardCache.flush());
+
 // Export for use in other modules
 export { ScryfallAPI, CSVHandler, CardCache };